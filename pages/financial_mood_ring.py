@@ -9,13 +9,252 @@ import plotly.graph_objects as go
 import plotly.express as px
 import datetime
 from datetime import datetime, timedelta
-import random
 import json
 import os
 from PIL import Image
 from io import BytesIO
 import base64
 import colorsys
+import html
+import re
+
+def _minify(markup):
+    """Collapse whitespace in static HTML so less markup is sent on every rerun"""
+    return re.sub(r">\s+<", "><", re.sub(r"\s+", " ", markup)).strip()
+
+# Mood ring markup, filled in by generate_mood_ring
+_RING_TMPL = _minify("""<div style="display: flex; flex-direction: column; align-items: center; margin: 20px 0;">
+    <div style="width: 120px; height: 120px; border-radius: 60px; 
+               background: radial-gradient(circle at 30% 30%, white, {color});
+               box-shadow: 0 0 15px rgba(0,0,0,0.2), inset 0 0 8px rgba(0,0,0,0.1);
+               border: 1px solid #ccc;">
+    </div>
+    <div style="margin-top: 15px; text-align: center;">
+        <div style="font-weight: bold; margin-bottom: 5px;">Mood Metrics</div>
+        <div style="font-size: 0.9rem;">Risk Appetite: {risk:.1f}/10</div>
+        <div style="font-size: 0.9rem;">Emotional Bias: {bias:.1f}/10</div>
+    </div>
+</div>
+""")
+
+# Columns of the mood history DataFrame kept in session state
+_MOOD_COLUMNS = [
+    "date", "market_sentiment", "confidence", "anxiety", "fomo", "news_impact",
+    "risk_appetite", "emotional_bias", "investor_type", "notes", "actions"
+]
+
+# Collapsible markup for a single detailed mood entry
+_ENTRY_TMPL = _minify("""<details{open} style="border: 1px solid #ddd; border-radius: 5px; padding: 10px; margin-bottom: 10px;">
+    <summary style="cursor: pointer;">Entry from {date}</summary>
+    <div style="display: grid; grid-template-columns: 2fr 1fr; gap: 1rem; margin-top: 10px;">
+        <div>{details}</div>
+        <div>{ring}<p><strong>Investor Type:</strong> {investor_type}</p></div>
+    </div>
+</details>
+""")
+
+_ENTRY_METRICS = (
+    ("Market Sentiment", "market_sentiment"),
+    ("Confidence Level", "confidence"),
+    ("Anxiety Level", "anxiety"),
+    ("FOMO Level", "fomo"),
+    ("News Impact", "news_impact"),
+)
+
+# Timeline colors for each investor type
+_INVESTOR_TYPE_COLORS = {
+    "Calculated Risk-Taker": "#1E88E5",
+    "Emotional Optimist": "#FFC107",
+    "Balanced Investor": "#4CAF50",
+    "News-Reactive Investor": "#FF9800",
+    "Conservative Planner": "#9C27B0",
+    "Anxious Guardian": "#F44336"
+}
+
+# Insight and recommendation text for each investor type
+_TYPE_DESCRIPTIONS = {
+    "Calculated Risk-Taker": "You're comfortable taking calculated risks while keeping emotions in check. This balanced approach can lead to strong long-term results when paired with thorough analysis.",
+    "Emotional Optimist": "Your optimism drives you to seek opportunities, but your emotional biases may sometimes cloud judgment. Implementing systematic checks before major decisions could be beneficial.",
+    "Balanced Investor": "You maintain a healthy balance between risk and caution, while keeping emotions relatively controlled. This balanced approach serves most investors well over time.",
+    "News-Reactive Investor": "You're significantly influenced by market news and may react quickly to headlines. Developing a more systematic approach to evaluating news could improve decision quality.",
+    "Conservative Planner": "You take a cautious approach while maintaining emotional discipline. While this protects capital, ensure you're not being too conservative for your long-term goals.",
+    "Anxious Guardian": "Your caution is driven by emotional concerns about market risks. This protective stance helps avoid losses but may limit growth potential."
+}
+
+_TYPE_RECOMMENDATIONS = {
+    "Calculated Risk-Taker": "Balance your comfort with risk by implementing structured position sizing rules. Limit any single position to a predefined percentage of your portfolio regardless of conviction level.",
+    "Emotional Optimist": "Create a pre-investment checklist that includes contrarian questions: 'What could go wrong?' and 'What evidence contradicts my thesis?' Answer these in writing before investing.",
+    "Balanced Investor": "Maintain your balanced approach while implementing a systematic rebalancing schedule (e.g., quarterly) to ensure your portfolio doesn't drift toward either excessive risk or excessive caution.",
+    "News-Reactive Investor": "For each major piece of financial news, write down its likely impact on your investments over different time frames: 1 week, 1 month, 1 year, and 5 years. This helps distinguish between short-term noise and long-term significance.",
+    "Conservative Planner": "Review your long-term financial goals annually to ensure your conservative approach isn't creating a gap between your investment returns and your required future capital.",
+    "Anxious Guardian": "Allocate a small percentage of your portfolio (5-10%) as an 'opportunity fund' that allows for calculated risk-taking without endangering your core financial security."
+}
+
+# Card markup for personalized insights and recommendations
+_INSIGHT_TMPL = _minify("""<div style="background-color: rgba(240, 242, 246, 0.8); 
+            padding: 15px; 
+            border-radius: 8px; 
+            margin-bottom: 10px;
+            border-left: 4px solid #2575fc;">
+    <p style="margin: 0;"><strong>Insight {number}:</strong> {insight}</p>
+</div>
+""")
+
+_RECOMMENDATION_TMPL = _minify("""<div style="display: flex; align-items: center; margin-bottom: 10px;">
+    <div style="background-color: #2575fc; 
+                color: white; 
+                width: 25px; 
+                height: 25px; 
+                border-radius: 50%; 
+                text-align: center; 
+                line-height: 25px;
+                margin-right: 10px;
+                flex-shrink: 0;">
+        {number}
+    </div>
+    <div style="background-color: rgba(240, 242, 246, 0.8); 
+                padding: 10px 15px; 
+                border-radius: 8px;
+                flex-grow: 1;">
+        {recommendation}
+    </div>
+</div>
+""")
+
+# Cognitive biases shown in the psychology tips tab: (name, bias, overcoming strategies)
+_COGNITIVE_BIASES = (
+    ("Loss Aversion",
+     "The pain of losses is psychologically about twice as powerful as the pleasure of gains.",
+     ("Focus on total portfolio performance rather than individual positions",
+      "Establish predetermined exit strategies before investing",
+      "Reframe losses as the cost of education and long-term growth",
+      "Set regular portfolio review schedules rather than checking constantly")),
+    ("Recency Bias",
+     "Overweighting recent events and experiences when making decisions, assuming patterns from the immediate past will continue.",
+     ("Study longer historical periods when analyzing investments",
+      "Maintain a decision journal to track your thinking at different market phases",
+      "Ask: \"Would I make this same decision if the market had been flat the past month?\"",
+      "Consider multiple future scenarios, not just extensions of the present")),
+    ("Confirmation Bias",
+     "Seeking information that confirms existing beliefs while avoiding contradictory data.",
+     ("Actively seek contradictory information to your investment thesis",
+      "Follow analysts and sources with different viewpoints",
+      "Ask a trusted friend to play \"devil's advocate\" on major investment decisions",
+      "Create a pre-investment checklist that includes examining contrary evidence")),
+    ("Herd Mentality",
+     "Following what others are doing based on emotional contagion rather than independent analysis.",
+     ("Develop your own investment philosophy and written criteria",
+      "Limit exposure to investment social media during volatile markets",
+      "Wait 24-48 hours before acting on \"hot tips\" or trending investments",
+      "Calculate and record your own valuation rather than relying on market consensus")),
+    ("Anchoring Bias",
+     "Over-relying on the first piece of information encountered (like purchase price) when making decisions.",
+     ("Regularly reevaluate investments as if you were seeing them for the first time",
+      "Use the \"blind analysis\" technique - evaluate metrics without knowing which company they belong to",
+      "Ask \"Would I buy this investment today at the current price?\" If no, consider selling",
+      "Set price targets based on intrinsic value calculations, not purchase price")),
+    ("Overconfidence Bias",
+     "Overestimating knowledge, abilities, and the precision of information, leading to excessive risk-taking.",
+     ("Track your predictions and review their accuracy periodically",
+      "Use probability ranges rather than point estimates in your analysis",
+      "Implement position sizing rules that limit exposure to any single investment",
+      "Seek feedback from others, especially those with different perspectives")),
+)
+
+_BEST_PRACTICES = (
+    {
+        "title": "Decision Journaling",
+        "description": "Keep a record of investment decisions, including your rationale, emotional state, and expected outcomes. Review periodically to identify patterns in your decision-making.",
+        "research": "Studies show that reflective practice improves decision-making over time by making cognitive biases more visible and identifiable to practitioners."
+    },
+    {
+        "title": "Systematic Rebalancing",
+        "description": "Set a regular schedule (e.g., quarterly) to rebalance your portfolio back to target allocations, regardless of market sentiment.",
+        "research": "Research suggests that systematic rebalancing can add approximately 0.5% in annual returns while reducing portfolio volatility."
+    },
+    {
+        "title": "Implementation Intentions",
+        "description": "Create specific 'if-then' plans for various market scenarios before they occur (e.g., 'If investment X drops 20%, then I will reevaluate but not immediately sell').",
+        "research": "Psychological research shows that pre-commitment to specific responses in anticipated situations significantly improves decision quality under emotional stress."
+    },
+    {
+        "title": "Cooling-Off Periods",
+        "description": "Implement mandatory waiting periods (24-48 hours) before making significant investment decisions, especially during market extremes.",
+        "research": "Studies demonstrate that even short cooling-off periods can significantly reduce the impact of emotional reactions on financial decisions."
+    },
+)
+
+# Markup for the bias sections and best-practice cards in the psychology tips tab
+_BIAS_TMPL = _minify("""<details{open} style="border: 1px solid #ddd; border-radius: 5px; padding: 10px; margin-bottom: 10px;">
+    <summary style="cursor: pointer; font-weight: bold;">{name}</summary>
+    <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 1rem; margin-top: 10px;">
+        <div style="background-color: #ffebee; padding: 10px; border-radius: 5px;">
+            <h4 style="color: #c62828; margin-top: 0;">The Bias</h4>
+            <p>{bias}</p>
+        </div>
+        <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px;">
+            <h4 style="color: #2e7d32; margin-top: 0;">Overcoming Strategies</h4>
+            <ul>{strategies}</ul>
+        </div>
+    </div>
+</details>
+""")
+
+_PRACTICE_TMPL = _minify("""<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-bottom: 15px;">
+    <h4 style="color: #1565c0; margin-top: 0;">{title}</h4>
+    <p><strong>Practice:</strong> {description}</p>
+    <p><strong>Research:</strong> <em>{research}</em></p>
+</div>
+""")
+
+def _build_tips_html():
+    """Pre-render the static bias cards and best practices as one HTML document"""
+    
+    biases_html = "".join(
+        _BIAS_TMPL.format(
+            open=" open" if i == 0 else "",
+            name=name,
+            bias=bias,
+            strategies="".join(f"<li>{strategy}</li>" for strategy in strategies)
+        )
+        for i, (name, bias, strategies) in enumerate(_COGNITIVE_BIASES)
+    )
+    
+    # Research-backed best practices section
+    practices_html = "".join(_PRACTICE_TMPL.format(**practice) for practice in _BEST_PRACTICES)
+    
+    return f"{biases_html}<h3>Research-Backed Best Practices</h3>{practices_html}"
+
+_TIPS_HTML = _build_tips_html()
+
+# Lower bounds of (sentiment, confidence, anxiety, fomo, news_impact) for each phase
+# of the sample data's market dip and recovery; each range spans 3 values
+_SAMPLE_PHASE_LOWS = np.array([
+    [5, 6, 3, 4, 3],  # Normal market
+    [3, 4, 5, 3, 6],  # Market starts declining
+    [2, 3, 7, 2, 7],  # Market bottom
+    [5, 5, 5, 5, 5],  # Recovery begins
+    [7, 7, 2, 6, 4],  # Bull market
+])
+
+# Seed for sample data, so demo histories are reproducible
+_SAMPLE_SEED = 42
+
+_SAMPLE_PHASE_NOTES = (
+    "Market seems stable. Considering adding to positions gradually.",
+    "Concerned about recent economic data. Market looks uncertain.",
+    "Significant market decline. Worried about portfolio losses.",
+    "Signs of recovery appearing. Still cautious but more optimistic.",
+    "Strong market recovery. Looking for growth opportunities.",
+)
+
+_SAMPLE_PHASE_ACTIONS = (
+    ("Research only", "Buy stocks/funds"),
+    ("Wait and observe", "Research only"),
+    ("Wait and observe",),
+    ("Research only", "Rebalance portfolio"),
+    ("Buy stocks/funds", "Deposit more funds"),
+)
 
 def show():
     """Display the financial mood ring page"""
@@ -39,7 +278,7 @@ def show():
     
     # Initialize session state for mood tracking
     if 'mood_history' not in st.session_state:
-        st.session_state.mood_history = []
+        st.session_state.mood_history = pd.DataFrame(columns=_MOOD_COLUMNS)
     
     if 'last_mood_date' not in st.session_state:
         st.session_state.last_mood_date = None
@@ -134,7 +373,7 @@ def mood_check_in():
         
         # Create mood ring visualization
         mood_ring_html = generate_mood_ring(risk_appetite, emotional_bias)
-        st.markdown(mood_ring_html, unsafe_allow_html=True)
+        st.html(mood_ring_html)
         
         # Determine the investor type
         investor_type = determine_investor_type(market_sentiment, confidence, anxiety, fomo, news_impact)
@@ -171,15 +410,13 @@ def mood_check_in():
         }
         
         # Update session state
-        # If already logged today, update the entry
-        if st.session_state.last_mood_date == today:
-            for i, entry in enumerate(st.session_state.mood_history):
-                if entry["date"] == today.strftime("%Y-%m-%d"):
-                    st.session_state.mood_history[i] = mood_data
-                    break
-        else:
-            st.session_state.mood_history.append(mood_data)
-            st.session_state.last_mood_date = today
+        # If already logged today, the new entry replaces it
+        history = st.session_state.mood_history
+        history = history[history['date'] != mood_data['date']]
+        new_entry = pd.DataFrame([mood_data], columns=_MOOD_COLUMNS)
+        
+        st.session_state.mood_history = new_entry if history.empty else pd.concat([history, new_entry], ignore_index=True)
+        st.session_state.last_mood_date = today
         
         st.success("Your mood has been recorded! Check the Mood History tab to see your emotional patterns.")
 
@@ -205,23 +442,30 @@ def generate_mood_ring(risk_appetite, emotional_bias):
         int(rgb[2] * 255)
     )
     
-    # Create CSS for mood ring
-    ring_html = f"""
-    <div style="display: flex; flex-direction: column; align-items: center; margin: 20px 0;">
-        <div style="width: 120px; height: 120px; border-radius: 60px; 
-                   background: radial-gradient(circle at 30% 30%, white, {color});
-                   box-shadow: 0 0 15px rgba(0,0,0,0.2), inset 0 0 8px rgba(0,0,0,0.1);
-                   border: 1px solid #ccc;">
-        </div>
-        <div style="margin-top: 15px; text-align: center;">
-            <div style="font-weight: bold; margin-bottom: 5px;">Mood Metrics</div>
-            <div style="font-size: 0.9rem;">Risk Appetite: {risk_appetite:.1f}/10</div>
-            <div style="font-size: 0.9rem;">Emotional Bias: {emotional_bias:.1f}/10</div>
-        </div>
-    </div>
-    """
+    return _RING_TMPL.format(color=color, risk=risk_appetite, bias=emotional_bias)
+
+def _render_mood_entry(entry, expanded=False):
+    """Render one mood history entry as a collapsible HTML block"""
     
-    return ring_html
+    details = "".join(
+        f"<p><strong>{label}:</strong> {entry[key]}/10</p>"
+        for label, key in _ENTRY_METRICS
+    )
+    
+    if entry.get('notes'):
+        details += f"<p><strong>Notes:</strong></p><p><em>{html.escape(entry['notes'])}</em></p>"
+    
+    if entry.get('actions'):
+        items = "".join(f"<li>{action}</li>" for action in entry['actions'])
+        details += f"<p><strong>Planned Actions:</strong></p><ul>{items}</ul>"
+    
+    return _ENTRY_TMPL.format(
+        open=" open" if expanded else "",
+        date=entry['date'],
+        details=details,
+        ring=generate_mood_ring(entry['risk_appetite'], entry['emotional_bias']),
+        investor_type=entry['investor_type']
+    )
 
 def determine_investor_type(sentiment, confidence, anxiety, fomo, news_impact):
     """Determine the investor type based on mood metrics"""
@@ -242,21 +486,37 @@ def determine_investor_type(sentiment, confidence, anxiety, fomo, news_impact):
     else:  # risk_appetite < 4 and emotional_bias > 4
         return "Anxious Guardian"
 
+def determine_investor_type_batch(vals):
+    """Determine investor types for an (N, 5) array of mood metrics in one pass"""
+    
+    risk_appetite = (vals[:, 0] + vals[:, 1] - vals[:, 2]) / 3
+    emotional_bias = vals[:, 2:].sum(axis=1) / 3
+    
+    high_risk = risk_appetite >= 7
+    mid_risk = (risk_appetite >= 4) & ~high_risk
+    low_bias = emotional_bias <= 4
+    
+    return np.select(
+        [high_risk & low_bias, high_risk, mid_risk & low_bias, mid_risk, low_bias],
+        ["Calculated Risk-Taker", "Emotional Optimist", "Balanced Investor",
+         "News-Reactive Investor", "Conservative Planner"],
+        default="Anxious Guardian"
+    )
+
 def show_mood_history():
     """Display the user's mood history"""
     
     st.header("Your Mood History")
     
-    if not st.session_state.mood_history:
+    if st.session_state.mood_history.empty:
         st.info("You haven't recorded any moods yet. Go to the Mood Check-in tab to get started.")
         # For demo, add sample data
         if st.button("Add Sample Data for Demonstration"):
             add_sample_mood_data()
             st.rerun()
     else:
-        # Create a DataFrame for visualization
-        df = pd.DataFrame(st.session_state.mood_history)
-        df['date'] = pd.to_datetime(df['date'])
+        # Parse dates for visualization
+        df = st.session_state.mood_history.assign(date=lambda d: pd.to_datetime(d['date']))
         df = df.sort_values('date')
         
         # Display mood history as a line chart
@@ -286,28 +546,19 @@ def show_mood_history():
         # Create a timeline of investor types
         fig = go.Figure()
         
-        investor_types = df['investor_type'].unique()
-        color_map = {
-            "Calculated Risk-Taker": "#1E88E5",
-            "Emotional Optimist": "#FFC107",
-            "Balanced Investor": "#4CAF50",
-            "News-Reactive Investor": "#FF9800",
-            "Conservative Planner": "#9C27B0",
-            "Anxious Guardian": "#F44336"
-        }
-        
-        for i, row in df.iterrows():
-            investor_type = row['investor_type']
+        shown_types = set()
+        for date, investor_type in df[['date', 'investor_type']].itertuples(index=False, name=None):
             fig.add_trace(go.Scatter(
-                x=[row['date'], row['date']],
+                x=[date, date],
                 y=[0, 1],
                 mode='lines',
-                line=dict(color=color_map.get(investor_type, "#666"), width=20),
+                line=dict(color=_INVESTOR_TYPE_COLORS.get(investor_type, "#666"), width=20),
                 name=investor_type,
-                showlegend=investor_type not in fig.data,
+                showlegend=investor_type not in shown_types,
                 hoverinfo='text',
-                hovertext=f"Date: {row['date'].strftime('%Y-%m-%d')}<br>Investor Type: {investor_type}"
+                hovertext=f"Date: {date.strftime('%Y-%m-%d')}<br>Investor Type: {investor_type}"
             ))
+            shown_types.add(investor_type)
         
         fig.update_layout(
             height=200,
@@ -320,47 +571,40 @@ def show_mood_history():
         st.plotly_chart(fig, use_container_width=True)
         
         # Display individual entries
-        st.subheader("Detailed Mood Entries")
-        
-        for i, entry in enumerate(reversed(st.session_state.mood_history)):
-            with st.expander(f"Entry from {entry['date']}", expanded=True if i == 0 else False):
-                # Create 2 columns
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    st.markdown(f"**Market Sentiment:** {entry['market_sentiment']}/10")
-                    st.markdown(f"**Confidence Level:** {entry['confidence']}/10")
-                    st.markdown(f"**Anxiety Level:** {entry['anxiety']}/10")
-                    st.markdown(f"**FOMO Level:** {entry['fomo']}/10")
-                    st.markdown(f"**News Impact:** {entry['news_impact']}/10")
-                    
-                    if entry.get('notes'):
-                        st.markdown("**Notes:**")
-                        st.markdown(f"*{entry['notes']}*")
-                    
-                    if entry.get('actions'):
-                        st.markdown("**Planned Actions:**")
-                        for action in entry['actions']:
-                            st.markdown(f"- {action}")
-                
-                with col2:
-                    # Display mood ring for this entry
-                    mood_ring_html = generate_mood_ring(entry['risk_appetite'], entry['emotional_bias'])
-                    st.markdown(mood_ring_html, unsafe_allow_html=True)
-                    st.markdown(f"**Investor Type:** {entry['investor_type']}")
+        show_mood_entries()
+
+@st.fragment
+def show_mood_entries():
+    """Display detailed mood entries, loading older ones on demand"""
+    
+    st.subheader("Detailed Mood Entries")
+    
+    # Only render the most recent entries; "Load 10 more" reruns just this fragment
+    history = st.session_state.mood_history
+    visible = st.session_state.setdefault('mood_visible', 10)
+    
+    entries_html = "".join(
+        _render_mood_entry(entry, expanded=(i == 0))
+        for i, entry in enumerate(history.iloc[::-1].head(visible).to_dict('records'))
+    )
+    st.html(entries_html)
+    
+    if len(history) > visible:
+        if st.button("Load 10 more"):
+            st.session_state.mood_visible += 10
+            st.rerun(scope="fragment")
 
 def emotional_analysis():
     """Analyze the user's emotional patterns"""
     
     st.header("Your Emotional Investment Analysis")
     
-    if not st.session_state.mood_history or len(st.session_state.mood_history) < 3:
+    if len(st.session_state.mood_history) < 3:
         st.info("You need at least 3 mood entries for meaningful analysis. Go to the Mood Check-in tab to add more entries.")
         return
     
-    # Create a DataFrame for analysis
-    df = pd.DataFrame(st.session_state.mood_history)
-    df['date'] = pd.to_datetime(df['date'])
+    # Parse dates for analysis
+    df = st.session_state.mood_history.assign(date=lambda d: pd.to_datetime(d['date']))
     df = df.sort_values('date')
     
     # Calculate emotional volatility
@@ -445,44 +689,20 @@ def emotional_analysis():
     
     insights = generate_personalized_insights(df)
     
-    for i, insight in enumerate(insights):
-        st.markdown(f"""
-        <div style="background-color: rgba(240, 242, 246, 0.8); 
-                    padding: 15px; 
-                    border-radius: 8px; 
-                    margin-bottom: 10px;
-                    border-left: 4px solid #2575fc;">
-            <p style="margin: 0;"><strong>Insight {i+1}:</strong> {insight}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    insights_html = "".join(
+        _INSIGHT_TMPL.format(number=i+1, insight=insight) for i, insight in enumerate(insights)
+    )
+    st.html(insights_html)
     
     # Behavioral recommendations
     st.subheader("Your Personalized Recommendations")
     
     recommendations = generate_behavioral_recommendations(df)
     
-    for i, rec in enumerate(recommendations):
-        st.markdown(f"""
-        <div style="display: flex; align-items: center; margin-bottom: 10px;">
-            <div style="background-color: #2575fc; 
-                        color: white; 
-                        width: 25px; 
-                        height: 25px; 
-                        border-radius: 50%; 
-                        text-align: center; 
-                        line-height: 25px;
-                        margin-right: 10px;
-                        flex-shrink: 0;">
-                {i+1}
-            </div>
-            <div style="background-color: rgba(240, 242, 246, 0.8); 
-                        padding: 10px 15px; 
-                        border-radius: 8px;
-                        flex-grow: 1;">
-                {rec}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    recommendations_html = "".join(
+        _RECOMMENDATION_TMPL.format(number=i+1, recommendation=rec) for i, rec in enumerate(recommendations)
+    )
+    st.html(recommendations_html)
 
 def generate_personalized_insights(df):
     """Generate personalized insights based on mood history"""
@@ -500,15 +720,7 @@ def generate_personalized_insights(df):
     
     # Insight 2: Most common investor type
     most_common_type = df['investor_type'].value_counts().idxmax()
-    type_descriptions = {
-        "Calculated Risk-Taker": "You're comfortable taking calculated risks while keeping emotions in check. This balanced approach can lead to strong long-term results when paired with thorough analysis.",
-        "Emotional Optimist": "Your optimism drives you to seek opportunities, but your emotional biases may sometimes cloud judgment. Implementing systematic checks before major decisions could be beneficial.",
-        "Balanced Investor": "You maintain a healthy balance between risk and caution, while keeping emotions relatively controlled. This balanced approach serves most investors well over time.",
-        "News-Reactive Investor": "You're significantly influenced by market news and may react quickly to headlines. Developing a more systematic approach to evaluating news could improve decision quality.",
-        "Conservative Planner": "You take a cautious approach while maintaining emotional discipline. While this protects capital, ensure you're not being too conservative for your long-term goals.",
-        "Anxious Guardian": "Your caution is driven by emotional concerns about market risks. This protective stance helps avoid losses but may limit growth potential."
-    }
-    insights.append(f"You primarily exhibit traits of a {most_common_type}. {type_descriptions.get(most_common_type, '')}")
+    insights.append(f"You primarily exhibit traits of a {most_common_type}. {_TYPE_DESCRIPTIONS.get(most_common_type, '')}")
     
     # Insight 3: FOMO analysis
     avg_fomo = df['fomo'].mean()
@@ -564,17 +776,8 @@ def generate_behavioral_recommendations(df):
     # Recommendation based on most common investor type
     most_common_type = df['investor_type'].value_counts().idxmax()
     
-    type_recommendations = {
-        "Calculated Risk-Taker": "Balance your comfort with risk by implementing structured position sizing rules. Limit any single position to a predefined percentage of your portfolio regardless of conviction level.",
-        "Emotional Optimist": "Create a pre-investment checklist that includes contrarian questions: 'What could go wrong?' and 'What evidence contradicts my thesis?' Answer these in writing before investing.",
-        "Balanced Investor": "Maintain your balanced approach while implementing a systematic rebalancing schedule (e.g., quarterly) to ensure your portfolio doesn't drift toward either excessive risk or excessive caution.",
-        "News-Reactive Investor": "For each major piece of financial news, write down its likely impact on your investments over different time frames: 1 week, 1 month, 1 year, and 5 years. This helps distinguish between short-term noise and long-term significance.",
-        "Conservative Planner": "Review your long-term financial goals annually to ensure your conservative approach isn't creating a gap between your investment returns and your required future capital.",
-        "Anxious Guardian": "Allocate a small percentage of your portfolio (5-10%) as an 'opportunity fund' that allows for calculated risk-taking without endangering your core financial security."
-    }
-    
-    if most_common_type in type_recommendations:
-        recommendations.append(type_recommendations[most_common_type])
+    if most_common_type in _TYPE_RECOMMENDATIONS:
+        recommendations.append(_TYPE_RECOMMENDATIONS[most_common_type])
     
     return recommendations
 
@@ -588,285 +791,55 @@ def show_psychology_tips():
     Here are key cognitive biases that affect investors and strategies to overcome them.
     """)
     
-    # Create expandable sections for each cognitive bias
-    with st.expander("Loss Aversion", expanded=True):
-        col1, col2 = st.columns([1, 2])
-        
-        with col1:
-            st.markdown("""
-            <div style="background-color: #ffebee; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #c62828; margin-top: 0;">The Bias</h4>
-                <p>The pain of losses is psychologically about twice as powerful as the pleasure of gains.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #2e7d32; margin-top: 0;">Overcoming Strategies</h4>
-                <ul>
-                    <li>Focus on total portfolio performance rather than individual positions</li>
-                    <li>Establish predetermined exit strategies before investing</li>
-                    <li>Reframe losses as the cost of education and long-term growth</li>
-                    <li>Set regular portfolio review schedules rather than checking constantly</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with st.expander("Recency Bias"):
-        col1, col2 = st.columns([1, 2])
-        
-        with col1:
-            st.markdown("""
-            <div style="background-color: #ffebee; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #c62828; margin-top: 0;">The Bias</h4>
-                <p>Overweighting recent events and experiences when making decisions, assuming patterns from the immediate past will continue.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #2e7d32; margin-top: 0;">Overcoming Strategies</h4>
-                <ul>
-                    <li>Study longer historical periods when analyzing investments</li>
-                    <li>Maintain a decision journal to track your thinking at different market phases</li>
-                    <li>Ask: "Would I make this same decision if the market had been flat the past month?"</li>
-                    <li>Consider multiple future scenarios, not just extensions of the present</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with st.expander("Confirmation Bias"):
-        col1, col2 = st.columns([1, 2])
-        
-        with col1:
-            st.markdown("""
-            <div style="background-color: #ffebee; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #c62828; margin-top: 0;">The Bias</h4>
-                <p>Seeking information that confirms existing beliefs while avoiding contradictory data.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #2e7d32; margin-top: 0;">Overcoming Strategies</h4>
-                <ul>
-                    <li>Actively seek contradictory information to your investment thesis</li>
-                    <li>Follow analysts and sources with different viewpoints</li>
-                    <li>Ask a trusted friend to play "devil's advocate" on major investment decisions</li>
-                    <li>Create a pre-investment checklist that includes examining contrary evidence</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with st.expander("Herd Mentality"):
-        col1, col2 = st.columns([1, 2])
-        
-        with col1:
-            st.markdown("""
-            <div style="background-color: #ffebee; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #c62828; margin-top: 0;">The Bias</h4>
-                <p>Following what others are doing based on emotional contagion rather than independent analysis.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #2e7d32; margin-top: 0;">Overcoming Strategies</h4>
-                <ul>
-                    <li>Develop your own investment philosophy and written criteria</li>
-                    <li>Limit exposure to investment social media during volatile markets</li>
-                    <li>Wait 24-48 hours before acting on "hot tips" or trending investments</li>
-                    <li>Calculate and record your own valuation rather than relying on market consensus</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with st.expander("Anchoring Bias"):
-        col1, col2 = st.columns([1, 2])
-        
-        with col1:
-            st.markdown("""
-            <div style="background-color: #ffebee; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #c62828; margin-top: 0;">The Bias</h4>
-                <p>Over-relying on the first piece of information encountered (like purchase price) when making decisions.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #2e7d32; margin-top: 0;">Overcoming Strategies</h4>
-                <ul>
-                    <li>Regularly reevaluate investments as if you were seeing them for the first time</li>
-                    <li>Use the "blind analysis" technique - evaluate metrics without knowing which company they belong to</li>
-                    <li>Ask "Would I buy this investment today at the current price?" If no, consider selling</li>
-                    <li>Set price targets based on intrinsic value calculations, not purchase price</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    with st.expander("Overconfidence Bias"):
-        col1, col2 = st.columns([1, 2])
-        
-        with col1:
-            st.markdown("""
-            <div style="background-color: #ffebee; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #c62828; margin-top: 0;">The Bias</h4>
-                <p>Overestimating knowledge, abilities, and the precision of information, leading to excessive risk-taking.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background-color: #e8f5e9; padding: 10px; border-radius: 5px;">
-                <h4 style="color: #2e7d32; margin-top: 0;">Overcoming Strategies</h4>
-                <ul>
-                    <li>Track your predictions and review their accuracy periodically</li>
-                    <li>Use probability ranges rather than point estimates in your analysis</li>
-                    <li>Implement position sizing rules that limit exposure to any single investment</li>
-                    <li>Seek feedback from others, especially those with different perspectives</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Research-backed best practices section
-    st.subheader("Research-Backed Best Practices")
-    
-    best_practices = [
-        {
-            "title": "Decision Journaling",
-            "description": "Keep a record of investment decisions, including your rationale, emotional state, and expected outcomes. Review periodically to identify patterns in your decision-making.",
-            "research": "Studies show that reflective practice improves decision-making over time by making cognitive biases more visible and identifiable to practitioners."
-        },
-        {
-            "title": "Systematic Rebalancing",
-            "description": "Set a regular schedule (e.g., quarterly) to rebalance your portfolio back to target allocations, regardless of market sentiment.",
-            "research": "Research suggests that systematic rebalancing can add approximately 0.5% in annual returns while reducing portfolio volatility."
-        },
-        {
-            "title": "Implementation Intentions",
-            "description": "Create specific 'if-then' plans for various market scenarios before they occur (e.g., 'If investment X drops 20%, then I will reevaluate but not immediately sell').",
-            "research": "Psychological research shows that pre-commitment to specific responses in anticipated situations significantly improves decision quality under emotional stress."
-        },
-        {
-            "title": "Cooling-Off Periods",
-            "description": "Implement mandatory waiting periods (24-48 hours) before making significant investment decisions, especially during market extremes.",
-            "research": "Studies demonstrate that even short cooling-off periods can significantly reduce the impact of emotional reactions on financial decisions."
-        }
-    ]
-    
-    for practice in best_practices:
-        st.markdown(f"""
-        <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; margin-bottom: 15px;">
-            <h4 style="color: #1565c0; margin-top: 0;">{practice['title']}</h4>
-            <p><strong>Practice:</strong> {practice['description']}</p>
-            <p><strong>Research:</strong> <em>{practice['research']}</em></p>
-        </div>
-        """, unsafe_allow_html=True)
+    # All bias cards and best practices are static, so they are rendered from a
+    # single prebuilt HTML block instead of dozens of individual elements
+    st.html(_TIPS_HTML)
+
+@st.cache_data(show_spinner=False)
+def _generate_sample_mood_data(seed, today_iso):
+    """Generate 14 days of sample mood data ending the day before today_iso"""
+    
+    today = datetime.strptime(today_iso, "%Y-%m-%d").date()
+    
+    # Generate sample data for the 14 days leading up to (but not including) today
+    dates = pd.date_range(end=today - timedelta(days=1), periods=14).strftime("%Y-%m-%d").tolist()
+    
+    # Draw all 14 days of metrics in a single call
+    phases = np.minimum(np.arange(14) // 3, 4)
+    lows = _SAMPLE_PHASE_LOWS[phases]
+    vals = np.random.default_rng(seed).integers(lows, lows + 3)
+    
+    # Calculate metrics
+    risk_appetite = (vals[:, 0] + vals[:, 1] - vals[:, 2]) / 3
+    emotional_bias = vals[:, 2:].sum(axis=1) / 3
+    
+    return pd.DataFrame({
+        "date": dates,
+        "market_sentiment": vals[:, 0],
+        "confidence": vals[:, 1],
+        "anxiety": vals[:, 2],
+        "fomo": vals[:, 3],
+        "news_impact": vals[:, 4],
+        "risk_appetite": risk_appetite,
+        "emotional_bias": emotional_bias,
+        "investor_type": determine_investor_type_batch(vals),
+        "notes": [_SAMPLE_PHASE_NOTES[phase] for phase in phases],
+        "actions": [list(_SAMPLE_PHASE_ACTIONS[phase]) for phase in phases]
+    }, columns=_MOOD_COLUMNS)
 
 def add_sample_mood_data():
     """Add sample mood data for demonstration"""
     
-    # Generate sample data for the last 14 days
-    sample_data = []
-    
     today = datetime.now().date()
     
-    # Create sample patterns
-    for i in range(14):
-        entry_date = today - timedelta(days=14-i)
-        
-        # Create a realistic pattern (market dip and recovery)
-        if i < 3:
-            # Normal market
-            sentiment = random.randint(5, 7)
-            confidence = random.randint(6, 8)
-            anxiety = random.randint(3, 5)
-            fomo = random.randint(4, 6)
-            news_impact = random.randint(3, 5)
-        elif i < 6:
-            # Market starts declining
-            sentiment = random.randint(3, 5)
-            confidence = random.randint(4, 6)
-            anxiety = random.randint(5, 7)
-            fomo = random.randint(3, 5)
-            news_impact = random.randint(6, 8)
-        elif i < 9:
-            # Market bottom
-            sentiment = random.randint(2, 4)
-            confidence = random.randint(3, 5)
-            anxiety = random.randint(7, 9)
-            fomo = random.randint(2, 4)
-            news_impact = random.randint(7, 9)
-        elif i < 12:
-            # Recovery begins
-            sentiment = random.randint(5, 7)
-            confidence = random.randint(5, 7)
-            anxiety = random.randint(5, 7)
-            fomo = random.randint(5, 7)
-            news_impact = random.randint(5, 7)
-        else:
-            # Bull market
-            sentiment = random.randint(7, 9)
-            confidence = random.randint(7, 9)
-            anxiety = random.randint(2, 4)
-            fomo = random.randint(6, 8)
-            news_impact = random.randint(4, 6)
-        
-        # Calculate metrics
-        risk_appetite = (sentiment + confidence - anxiety) / 3
-        emotional_bias = (anxiety + fomo + news_impact) / 3
-        
-        # Determine investor type
-        investor_type = determine_investor_type(sentiment, confidence, anxiety, fomo, news_impact)
-        
-        # Create notes based on the phase
-        if i < 3:
-            notes = "Market seems stable. Considering adding to positions gradually."
-        elif i < 6:
-            notes = "Concerned about recent economic data. Market looks uncertain."
-        elif i < 9:
-            notes = "Significant market decline. Worried about portfolio losses."
-        elif i < 12:
-            notes = "Signs of recovery appearing. Still cautious but more optimistic."
-        else:
-            notes = "Strong market recovery. Looking for growth opportunities."
-        
-        # Create actions based on the phase
-        if i < 3:
-            actions = ["Research only", "Buy stocks/funds"]
-        elif i < 6:
-            actions = ["Wait and observe", "Research only"]
-        elif i < 9:
-            actions = ["Wait and observe"]
-        elif i < 12:
-            actions = ["Research only", "Rebalance portfolio"]
-        else:
-            actions = ["Buy stocks/funds", "Deposit more funds"]
-        
-        # Create the entry
-        entry = {
-            "date": entry_date.strftime("%Y-%m-%d"),
-            "market_sentiment": sentiment,
-            "confidence": confidence,
-            "anxiety": anxiety,
-            "fomo": fomo,
-            "news_impact": news_impact,
-            "risk_appetite": risk_appetite,
-            "emotional_bias": emotional_bias,
-            "investor_type": investor_type,
-            "notes": notes,
-            "actions": actions
-        }
-        
-        sample_data.append(entry)
+    # Sample data for today is already loaded (it ends yesterday), nothing to do
+    history = st.session_state.get('mood_history')
+    if (history is not None and len(history) == 14
+            and history['date'].iloc[-1] == (today - timedelta(days=1)).isoformat()):
+        return
     
     # Add to session state
-    st.session_state.mood_history = sample_data
+    st.session_state.mood_history = _generate_sample_mood_data(_SAMPLE_SEED, today.isoformat())
     st.session_state.last_mood_date = None  # Allow new entry today
 
 # Run the show function when this module is executed
@@ -1,16 +1,107 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 from utils.stock_data import (
     get_stock_data, 
     get_futures_options_data,
+    get_options_expirations,
     forecast_futures_indices
 )
 from utils.currency import format_currency, convert_usd_to_inr
 
+# Reference information for the common option strategies section
+STRATEGY_INFO = MappingProxyType({
+    "Covered Call": {
+        "description": "A strategy where you own the underlying stock and sell a call option against it.",
+        "use_case": "When you expect the stock to remain flat or rise slightly.",
+        "risk": "Limited upside potential, but reduced cost basis.",
+        "example": "Buy 100 shares of Reliance and sell 1 OTM call option."
+    },
+    "Protective Put": {
+        "description": "A strategy where you own the underlying stock and buy a put option to protect against downside.",
+        "use_case": "When you want to protect against a significant downside move.",
+        "risk": "Cost of the put option (premium).",
+        "example": "Buy 100 shares of HDFC Bank and buy 1 put option at or near the current price."
+    },
+    "Bull Call Spread": {
+        "description": "Buy a call option and sell a higher strike call option with the same expiration.",
+        "use_case": "When you expect a moderate rise in the stock or index.",
+        "risk": "Limited to the net premium paid.",
+        "example": "Buy NIFTY 22000 call and sell NIFTY 22500 call."
+    },
+    "Bear Put Spread": {
+        "description": "Buy a put option and sell a lower strike put option with the same expiration.",
+        "use_case": "When you expect a moderate decline in the stock or index.",
+        "risk": "Limited to the net premium paid.",
+        "example": "Buy NIFTY 22000 put and sell NIFTY 21500 put."
+    },
+    "Straddle": {
+        "description": "Buy a call and a put at the same strike price and expiration.",
+        "use_case": "When you expect a large move but are uncertain of the direction.",
+        "risk": "Limited to the combined premium paid for both options.",
+        "example": "Buy both a NIFTY 22000 call and a NIFTY 22000 put."
+    },
+    "Strangle": {
+        "description": "Buy a call with a higher strike price and a put with a lower strike price, same expiration.",
+        "use_case": "When you expect a large move but are uncertain of the direction, and want to reduce cost.",
+        "risk": "Limited to the combined premium paid for both options.",
+        "example": "Buy a NIFTY 22500 call and a NIFTY 21500 put."
+    }
+})
+
+# Description block shown for each strategy, formatted once at import
+_STRATEGY_MARKDOWN = MappingProxyType({
+    name: (
+        f"### {name}\n\n"
+        f"**Description:** {info['description']}\n\n"
+        f"**Use Case:** {info['use_case']}\n\n"
+        f"**Risk Profile:** {info['risk']}\n\n"
+        f"**Example:** {info['example']}"
+    )
+    for name, info in STRATEGY_INFO.items()
+})
+
+# Payoff at expiration for each strategy, with the stock price as a percentage of the base price.
+# Values fit in small integer types, which Plotly ships to the browser as compact typed arrays.
+_PAYOFF_X = np.arange(90, 111, dtype=np.int16)
+_PAYOFF_Y = MappingProxyType({
+    name: payoff.astype(np.int8)
+    for name, payoff in {
+        "Covered Call": np.minimum(10, _PAYOFF_X - 90),
+        "Protective Put": np.maximum(_PAYOFF_X - 100, 0) - 2,
+        "Bull Call Spread": np.clip(_PAYOFF_X - 95, -2, 5),
+        "Bear Put Spread": np.clip(105 - _PAYOFF_X, -2, 5),
+        "Straddle": np.maximum(np.abs(_PAYOFF_X - 100) - 5, -5),
+        "Strangle": np.maximum(np.maximum(_PAYOFF_X - 105, 95 - _PAYOFF_X), -3)
+    }.items()
+})
+
+# Forecasts and option chains are cached as shared resources: every session reads the
+# same object instead of unpickling a private copy, so callers must not mutate them
+@st.cache_resource(ttl=900, show_spinner=False)
+def _cached_forecast(ticker, days_forward):
+    """Cached wrapper around forecast_futures_indices"""
+    return forecast_futures_indices(ticker, days_forward)
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _cached_history(ticker):
+    """Cached 30-day price history used as context for the forecast chart"""
+    return get_stock_data(ticker, period='30d')
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_expirations(ticker):
+    """Cached wrapper around get_options_expirations"""
+    return get_options_expirations(ticker)
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _cached_options_data(ticker, expiration=None):
+    """Cached wrapper around get_futures_options_data"""
+    return get_futures_options_data(ticker, expiration)
+
 def show():
     """Display the futures and options analysis page"""
     st.title("Futures & Options Analysis")
@@ -33,7 +124,9 @@ def show():
     
     with tab2:
         show_options_analysis()
+        show_option_strategies()
 
+@st.fragment
 def show_futures_forecasting():
     """Display the futures forecasting section"""
     st.subheader("Futures Forecasting")
@@ -52,6 +145,9 @@ def show_futures_forecasting():
     
     ticker = indices[selected_index]
     
+    # Historical data for context, independent of the forecast horizon
+    historical = _cached_history(ticker)
+    
     # Days to forecast
     days_forward = st.slider(
         "Days to Forecast",
@@ -62,7 +158,7 @@ def show_futures_forecasting():
     
     # Generate forecast
     with st.spinner(f"Forecasting {selected_index} futures..."):
-        forecast_data = forecast_futures_indices(ticker, days_forward)
+        forecast_data = _cached_forecast(ticker, days_forward)
     
     if forecast_data is None:
         st.error("Could not generate forecast. Please try another index.")
@@ -83,9 +179,8 @@ def show_futures_forecasting():
         forecast_df = pd.DataFrame(forecast_data['forecast'])
         
         # Format values with Rupee symbol
-        forecast_df['prediction'] = forecast_df['prediction'].map(lambda x: f"₹{x:,.2f}")
-        forecast_df['lower_bound'] = forecast_df['lower_bound'].map(lambda x: f"₹{x:,.2f}")
-        forecast_df['upper_bound'] = forecast_df['upper_bound'].map(lambda x: f"₹{x:,.2f}")
+        for col in ['prediction', 'lower_bound', 'upper_bound']:
+            forecast_df[col] = _fmt_inr(forecast_df[col])
         
         # Rename columns for display
         forecast_df.columns = ['Date', 'Prediction', 'Lower Bound', 'Upper Bound']
@@ -95,15 +190,12 @@ def show_futures_forecasting():
         # Create visualization of forecast
         raw_forecast = pd.DataFrame(forecast_data['forecast'])
         
-        # Historical data for context
-        historical = get_stock_data(ticker, period='30d')
-        
         if historical is not None and not historical.empty:
             # Create the graph
             fig = go.Figure()
             
             # Add historical data
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=historical.index,
                 y=historical['Close'],
                 mode='lines',
@@ -114,7 +206,7 @@ def show_futures_forecasting():
             # Add forecast
             dates = pd.to_datetime(raw_forecast['date'])
             
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=dates,
                 y=raw_forecast['prediction'],
                 mode='lines+markers',
@@ -123,7 +215,7 @@ def show_futures_forecasting():
             ))
             
             # Add confidence intervals
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=dates.tolist() + dates.tolist()[::-1],
                 y=raw_forecast['upper_bound'].tolist() + raw_forecast['lower_bound'].tolist()[::-1],
                 fill='toself',
@@ -171,17 +263,196 @@ def show_futures_forecasting():
         with col3:
             # Risk assessment based on volatility
             risk_level = "High" if volatility_annual > 25 else "Medium" if volatility_annual > 15 else "Low"
-            risk_color = {"High": "red", "Medium": "orange", "Low": "green"}
-            st.markdown(
-                f"""
-                <div style='border:1px solid {risk_color[risk_level]}; border-radius:5px; padding:10px;'>
-                <h3 style='color:{risk_color[risk_level]};'>Risk Level: {risk_level}</h3>
-                <p>Based on historical volatility</p>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+            risk_box = {"High": st.error, "Medium": st.warning, "Low": st.success}
+            risk_box[risk_level](f"**Risk Level: {risk_level}**\n\nBased on historical volatility")
+
+def _fmt_inr(values):
+    """Format a numeric Series as rupee strings, with N/A for missing values"""
+    return values.map("₹{:,.2f}".format).where(values.notna(), "N/A")
+
+# Shared layout for the compact option chain charts
+_BASE_LAYOUT = {'height': 350, 'margin': {'l': 40, 'r': 10, 't': 40, 'b': 40}}
+
+_STATUS_BADGES = {'ITM': '🟢 ITM', 'ATM': '🟡 ATM', 'OTM': '🔴 OTM'}
+
+# Display labels and formatters for option chain columns
+_OPTION_COLUMN_LABELS = {
+    'strike': 'Strike Price', 
+    'lastPrice': 'Last Price', 
+    'bid': 'Bid', 
+    'ask': 'Ask', 
+    'volume': 'Volume', 
+    'openInterest': 'Open Interest', 
+    'impliedVolatility': 'Implied Volatility',
+    'status': 'Status',
+    'theta': 'Theta (₹/day)'
+}
+
+_OPTION_COLUMN_FORMATTERS = {
+    'impliedVolatility': lambda values: values * 100,
+    # Moneyness is shown as a colored badge instead of highlighting each row
+    'status': lambda values: values.map(_STATUS_BADGES).fillna(values)
+}
+
+# Numbers stay numeric (and sortable); the browser applies these formats
+_OPTION_COLUMN_CONFIG = {
+    'Strike Price': st.column_config.NumberColumn(format="₹%.2f"),
+    'Last Price': st.column_config.NumberColumn(format="₹%.2f"),
+    'Bid': st.column_config.NumberColumn(format="₹%.2f"),
+    'Ask': st.column_config.NumberColumn(format="₹%.2f"),
+    'Implied Volatility': st.column_config.NumberColumn(format="%.2f%%"),
+    'Theta (₹/day)': st.column_config.NumberColumn(format="₹%.2f")
+}
+
+def _render_option_chain(options_df, aggs, option_type, color, options_data):
+    """Display the chain table and charts for one side (calls or puts) of the options data"""
+    
+    if options_df is None or options_df.empty:
+        st.info(f"No {option_type.lower()} options data available.")
+        return
+    
+    # Add toggle for additional columns like Greeks
+    show_advanced = st.checkbox("Show Advanced Metrics (Greeks)", key=f"{option_type.lower()}s_advanced")
+    
+    # Clean up the dataframe
+    base_cols = ['strike', 'lastPrice', 'bid', 'ask', 'volume', 'openInterest', 'impliedVolatility']
+    
+    if not all(col in options_df.columns for col in base_cols):
+        st.info("Limited options data available - missing some expected columns.")
+        st.dataframe(options_df)
+        return
+    
+    display_cols = base_cols
+    if show_advanced and 'status' in options_df.columns:
+        display_cols = base_cols + [col for col in ['status', 'theta'] if col in options_df.columns]
+    
+    # Format each column for display and rename it for better readability in one pass
+    display_df = pd.DataFrame(
+        {_OPTION_COLUMN_LABELS[col]: _OPTION_COLUMN_FORMATTERS.get(col, lambda values: values)(options_df[col])
+         for col in display_cols},
+        index=options_df.index
+    )
+    
+    st.dataframe(display_df, column_config=_OPTION_COLUMN_CONFIG, use_container_width=True)
+    
+    # Visualizations
+    st.subheader(f"{option_type} Options Analysis")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Visualization of open interest
+        fig = go.Figure({
+            'data': [{'type': 'bar', 'x': aggs['strike'], 'y': aggs['open_interest'], 'marker': {'color': color}}],
+            'layout': {
+                **_BASE_LAYOUT,
+                'title': {'text': f'{option_type} Options Open Interest by Strike Price'},
+                'xaxis': {'title': {'text': 'Strike Price (₹)'}},
+                'yaxis': {'title': {'text': 'Open Interest'}}
+            }
+        })
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Implied volatility smile/skew, filtering out extreme (>200%) values
+        iv = options_df['impliedVolatility'].to_numpy()
+        mask = np.isfinite(iv) & (iv < 2)
+        
+        if mask.any():
+            order = np.argsort(aggs['strike'][mask])
+            
+            fig = go.Figure({
+                'data': [{
+                    'type': 'scattergl',
+                    'mode': 'lines+markers',
+                    'x': aggs['strike'][mask][order],
+                    'y': iv[mask][order]
+                }],
+                'layout': {
+                    **_BASE_LAYOUT,
+                    'title': {'text': f'{option_type} Options Implied Volatility Curve'},
+                    'xaxis': {'title': {'text': 'Strike Price (₹)'}},
+                    'yaxis': {'title': {'text': 'Implied Volatility'}, 'tickformat': '.0%'}
+                }
+            })
+            
+            # Add current price reference line if available
+            if 'current_price' in options_data and options_data['current_price']:
+                fig.add_vline(
+                    x=options_data['current_price'], 
+                    line_dash="dash", 
+                    line_color="orange",
+                    annotation_text="Current Price",
+                    annotation_position="top right"
+                )
+            
+            st.plotly_chart(fig, use_container_width=True)
+
+def _limit_strike_window(calls_df, puts_df, spot, n_strikes):
+    """Keep only strikes within n_strikes strike steps of the spot price on both sides of the chain"""
+    
+    if any(df is None or 'strike' not in df.columns for df in (calls_df, puts_df)):
+        return calls_df, puts_df
+    
+    strikes = np.union1d(calls_df['strike'].to_numpy(), puts_df['strike'].to_numpy())
+    if strikes.size < 2:
+        return calls_df, puts_df
+    
+    step = np.median(np.diff(strikes))
+    low, high = spot - n_strikes * step, spot + n_strikes * step
+    
+    return (
+        calls_df[calls_df['strike'].between(low, high)],
+        puts_df[puts_df['strike'].between(low, high)]
+    )
+
+def _aggregate_chain(options_df):
+    """Extract the arrays and totals shared by the chain charts and the analytics tab"""
+    
+    if options_df is None or options_df.empty or 'strike' not in options_df.columns:
+        return {'strike': np.empty(0), 'open_interest': np.empty(0), 'total_volume': 0, 'total_oi': 0}
+    
+    open_interest = (options_df['openInterest'].fillna(0).to_numpy()
+                     if 'openInterest' in options_df.columns else np.zeros(len(options_df)))
+    
+    return {
+        'strike': options_df['strike'].to_numpy(),
+        'open_interest': open_interest,
+        'total_volume': options_df['volume'].sum() if 'volume' in options_df.columns else 0,
+        'total_oi': open_interest.sum()
+    }
+
+def _calculate_max_pain(call_aggs, put_aggs):
+    """
+    Total payout owed by option writers if the underlying expires at each strike
+    
+    Returns the sorted candidate strikes and the pain value at each of them.
+    """
+    call_strikes, call_oi = call_aggs['strike'], call_aggs['open_interest']
+    put_strikes, put_oi = put_aggs['strike'], put_aggs['open_interest']
+    
+    strikes = np.union1d(call_strikes, put_strikes)
+    
+    # Rows are candidate expiry prices, columns are contracts
+    call_pain = (np.maximum(strikes[:, None] - call_strikes[None, :], 0) * call_oi).sum(axis=1)
+    put_pain = (np.maximum(put_strikes[None, :] - strikes[:, None], 0) * put_oi).sum(axis=1)
+    
+    return strikes, call_pain + put_pain
 
+def _show_pc_ratio(label, ratio):
+    """Display a put/call ratio with the market sentiment it implies"""
+    
+    # Determine sentiment based on ratio
+    if ratio > 1.2:
+        sentiment, delta_color = "Bearish", "inverse"
+    elif ratio < 0.8:
+        sentiment, delta_color = "Bullish", "normal"
+    else:
+        sentiment, delta_color = "Neutral", "off"
+    
+    st.metric(label, f"{ratio:.2f}", delta=f"Market Sentiment: {sentiment}", delta_color=delta_color)
+
+@st.fragment
 def show_options_analysis():
     """Display the options analysis section"""
     st.subheader("Options Analysis")
@@ -208,26 +479,36 @@ def show_options_analysis():
     
     ticker = option_stocks[selected_stock]
     
-    # Get options data
-    with st.spinner(f"Loading options data for {selected_stock}..."):
-        options_data = get_futures_options_data(ticker)
+    # Expiration dates are looked up first so the chain is only fetched once
+    expirations = _cached_expirations(ticker)
     
-    if options_data is None:
+    if not expirations:
         st.error("No options data available for this instrument. Try another selection.")
         return
     
-    # Expiration date selection
+    # Expiration date selection, remembered per ticker across reruns
     with col2:
-        if 'all_expirations' in options_data and options_data['all_expirations']:
-            selected_expiration = st.selectbox(
-                "Expiration Date",
-                options_data['all_expirations'],
-                index=0
-            )
-            # Reload data with the selected expiration if it changed
-            if selected_expiration != options_data['expiration_date']:
-                with st.spinner(f"Loading options data for {selected_stock} with expiration {selected_expiration}..."):
-                    options_data = get_futures_options_data(ticker, selected_expiration)
+        selected_expiration = st.selectbox(
+            "Expiration Date",
+            expirations,
+            index=0,
+            key=f"exp_{ticker}"
+        )
+        n_strikes = st.slider(
+            "Strikes Around Spot",
+            min_value=5,
+            max_value=100,
+            value=20,
+            key="n_strikes"
+        )
+    
+    # Get options data
+    with st.spinner(f"Loading options data for {selected_stock} with expiration {selected_expiration}..."):
+        options_data = _cached_options_data(ticker, selected_expiration)
+    
+    if options_data is None:
+        st.error("No options data available for this instrument. Try another selection.")
+        return
     
     # Display options information
     if 'current_price' in options_data and options_data['current_price']:
@@ -240,233 +521,22 @@ def show_options_analysis():
     # Create tabs for calls and puts, and option analytics
     call_tab, put_tab, analysis_tab = st.tabs(["Call Options", "Put Options", "Options Analytics"])
     
+    calls_df = options_data['calls']
+    puts_df = options_data['puts']
+    
+    # Only strikes near spot are rendered and analyzed
+    if options_data.get('current_price'):
+        calls_df, puts_df = _limit_strike_window(calls_df, puts_df, options_data['current_price'], n_strikes)
+    
+    # Aggregate each side once and reuse it across charts and analytics
+    call_aggs = _aggregate_chain(calls_df)
+    put_aggs = _aggregate_chain(puts_df)
+    
     with call_tab:
-        calls_df = options_data['calls']
-        
-        if calls_df is not None and not calls_df.empty:
-            # Add toggle for additional columns like Greeks
-            show_advanced = st.checkbox("Show Advanced Metrics (Greeks)", key="calls_advanced")
-            
-            # Clean up the dataframe
-            base_cols = ['strike', 'lastPrice', 'bid', 'ask', 'volume', 'openInterest', 'impliedVolatility']
-            
-            if show_advanced and 'status' in calls_df.columns:
-                display_cols = base_cols + ['status', 'theta']
-            else:
-                display_cols = base_cols
-                
-            if all(col in calls_df.columns for col in base_cols):
-                display_df = calls_df[display_cols].copy()
-                
-                # Rename columns for better readability
-                col_mapping = {
-                    'strike': 'Strike Price', 
-                    'lastPrice': 'Last Price', 
-                    'bid': 'Bid', 
-                    'ask': 'Ask', 
-                    'volume': 'Volume', 
-                    'openInterest': 'Open Interest', 
-                    'impliedVolatility': 'Implied Volatility',
-                    'status': 'Status',
-                    'theta': 'Theta (₹/day)'
-                }
-                
-                display_df.columns = [col_mapping.get(col, col) for col in display_cols]
-                
-                # Convert to INR for display
-                for col in ['Strike Price', 'Last Price', 'Bid', 'Ask']:
-                    display_df[col] = display_df[col].apply(lambda x: f"₹{x:,.2f}" if pd.notna(x) else "N/A")
-                
-                # Format volatility as percentage
-                display_df['Implied Volatility'] = display_df['Implied Volatility'].apply(lambda x: f"{x*100:.2f}%" if pd.notna(x) else "N/A")
-                
-                if 'Theta (₹/day)' in display_df.columns:
-                    display_df['Theta (₹/day)'] = display_df['Theta (₹/day)'].apply(lambda x: f"₹{x:.2f}" if pd.notna(x) else "N/A")
-                
-                # Add color highlighting based on moneyness
-                if 'Status' in display_df.columns:
-                    def highlight_status(row):
-                        if row['Status'] == 'ITM':
-                            return ['background-color: rgba(0,200,83,0.2)'] * len(row)
-                        elif row['Status'] == 'OTM':
-                            return ['background-color: rgba(255,82,82,0.1)'] * len(row)
-                        else:  # ATM
-                            return ['background-color: rgba(255,215,0,0.2)'] * len(row)
-                    
-                    st.dataframe(
-                        display_df.style.apply(highlight_status, axis=1) if 'Status' in display_df.columns else display_df,
-                        use_container_width=True
-                    )
-                else:
-                    st.dataframe(display_df, use_container_width=True)
-                
-                # Visualizations
-                st.subheader("Call Options Analysis")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Visualization of open interest
-                    if 'openInterest' in calls_df.columns and 'strike' in calls_df.columns:
-                        fig = px.bar(
-                            calls_df,
-                            x='strike',
-                            y='openInterest',
-                            title='Call Options Open Interest by Strike Price',
-                            labels={'strike': 'Strike Price (₹)', 'openInterest': 'Open Interest'},
-                            color_discrete_sequence=['#00C853']
-                        )
-                        fig.update_layout(height=350)
-                        st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Implied volatility smile/skew
-                    if 'impliedVolatility' in calls_df.columns and 'strike' in calls_df.columns:
-                        # Filter out extreme values
-                        volatility_df = calls_df[calls_df['impliedVolatility'] < 2]  # Filter out >200% volatility
-                        
-                        if not volatility_df.empty:
-                            fig = px.line(
-                                volatility_df,
-                                x='strike',
-                                y='impliedVolatility',
-                                title='Call Options Implied Volatility Curve',
-                                labels={'strike': 'Strike Price (₹)', 'impliedVolatility': 'Implied Volatility'},
-                                markers=True
-                            )
-                            
-                            # Add current price reference line if available
-                            if 'current_price' in options_data and options_data['current_price']:
-                                fig.add_vline(
-                                    x=options_data['current_price'], 
-                                    line_dash="dash", 
-                                    line_color="orange",
-                                    annotation_text="Current Price",
-                                    annotation_position="top right"
-                                )
-                            
-                            fig.update_layout(height=350)
-                            fig.update_yaxes(tickformat='.0%')
-                            st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("Limited options data available - missing some expected columns.")
-                st.dataframe(calls_df)
-        else:
-            st.info("No call options data available.")
+        _render_option_chain(calls_df, call_aggs, "Call", "#00C853", options_data)
     
     with put_tab:
-        puts_df = options_data['puts']
-        
-        if puts_df is not None and not puts_df.empty:
-            # Add toggle for additional columns like Greeks
-            show_advanced = st.checkbox("Show Advanced Metrics (Greeks)", key="puts_advanced")
-            
-            # Clean up the dataframe
-            base_cols = ['strike', 'lastPrice', 'bid', 'ask', 'volume', 'openInterest', 'impliedVolatility']
-            
-            if show_advanced and 'status' in puts_df.columns:
-                display_cols = base_cols + ['status', 'theta']
-            else:
-                display_cols = base_cols
-                
-            if all(col in puts_df.columns for col in base_cols):
-                display_df = puts_df[display_cols].copy()
-                
-                # Rename columns for better readability
-                col_mapping = {
-                    'strike': 'Strike Price', 
-                    'lastPrice': 'Last Price', 
-                    'bid': 'Bid', 
-                    'ask': 'Ask', 
-                    'volume': 'Volume', 
-                    'openInterest': 'Open Interest', 
-                    'impliedVolatility': 'Implied Volatility',
-                    'status': 'Status',
-                    'theta': 'Theta (₹/day)'
-                }
-                
-                display_df.columns = [col_mapping.get(col, col) for col in display_cols]
-                
-                # Convert to INR for display
-                for col in ['Strike Price', 'Last Price', 'Bid', 'Ask']:
-                    display_df[col] = display_df[col].apply(lambda x: f"₹{x:,.2f}" if pd.notna(x) else "N/A")
-                
-                # Format volatility as percentage
-                display_df['Implied Volatility'] = display_df['Implied Volatility'].apply(lambda x: f"{x*100:.2f}%" if pd.notna(x) else "N/A")
-                
-                if 'Theta (₹/day)' in display_df.columns:
-                    display_df['Theta (₹/day)'] = display_df['Theta (₹/day)'].apply(lambda x: f"₹{x:.2f}" if pd.notna(x) else "N/A")
-                
-                # Add color highlighting based on moneyness
-                if 'Status' in display_df.columns:
-                    def highlight_status(row):
-                        if row['Status'] == 'ITM':
-                            return ['background-color: rgba(0,200,83,0.2)'] * len(row)
-                        elif row['Status'] == 'OTM':
-                            return ['background-color: rgba(255,82,82,0.1)'] * len(row)
-                        else:  # ATM
-                            return ['background-color: rgba(255,215,0,0.2)'] * len(row)
-                    
-                    st.dataframe(
-                        display_df.style.apply(highlight_status, axis=1) if 'Status' in display_df.columns else display_df,
-                        use_container_width=True
-                    )
-                else:
-                    st.dataframe(display_df, use_container_width=True)
-                
-                # Visualizations
-                st.subheader("Put Options Analysis")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Visualization of open interest
-                    if 'openInterest' in puts_df.columns and 'strike' in puts_df.columns:
-                        fig = px.bar(
-                            puts_df,
-                            x='strike',
-                            y='openInterest',
-                            title='Put Options Open Interest by Strike Price',
-                            labels={'strike': 'Strike Price (₹)', 'openInterest': 'Open Interest'},
-                            color_discrete_sequence=['#FF5252']
-                        )
-                        fig.update_layout(height=350)
-                        st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    # Implied volatility smile/skew
-                    if 'impliedVolatility' in puts_df.columns and 'strike' in puts_df.columns:
-                        # Filter out extreme values
-                        volatility_df = puts_df[puts_df['impliedVolatility'] < 2]  # Filter out >200% volatility
-                        
-                        if not volatility_df.empty:
-                            fig = px.line(
-                                volatility_df,
-                                x='strike',
-                                y='impliedVolatility',
-                                title='Put Options Implied Volatility Curve',
-                                labels={'strike': 'Strike Price (₹)', 'impliedVolatility': 'Implied Volatility'},
-                                markers=True
-                            )
-                            
-                            # Add current price reference line if available
-                            if 'current_price' in options_data and options_data['current_price']:
-                                fig.add_vline(
-                                    x=options_data['current_price'], 
-                                    line_dash="dash", 
-                                    line_color="orange",
-                                    annotation_text="Current Price",
-                                    annotation_position="top right"
-                                )
-                            
-                            fig.update_layout(height=350)
-                            fig.update_yaxes(tickformat='.0%')
-                            st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info("Limited options data available - missing some expected columns.")
-                st.dataframe(puts_df)
-        else:
-            st.info("No put options data available.")
+        _render_option_chain(puts_df, put_aggs, "Put", "#FF5252", options_data)
             
     with analysis_tab:
         st.subheader("Options Analysis Tools")
@@ -475,7 +545,7 @@ def show_options_analysis():
             current_price = options_data['current_price']
             
             # Max Pain Analysis (the strike price at which option writers have the least amount of financial loss)
-            if 'calls' in options_data and 'puts' in options_data and 'strike' in calls_df.columns and 'openInterest' in calls_df.columns:
+            if call_aggs['strike'].size > 0 and put_aggs['strike'].size > 0:
                 st.markdown("### Max Pain Analysis")
                 st.markdown("""
                 **Max Pain Theory**: The point where option writers (sellers) will lose the least amount of money.
@@ -483,23 +553,10 @@ def show_options_analysis():
                 """)
                 
                 # Calculate max pain
-                strikes = sorted(set(calls_df['strike'].tolist()).union(set(puts_df['strike'].tolist())))
-                
-                pain_values = []
-                for strike in strikes:
-                    # Calculate pain for call options at this strike
-                    call_pain = sum(max(0, current_price - k) * oi for k, oi in 
-                                  zip(calls_df['strike'], calls_df['openInterest']) if k <= strike)
-                    
-                    # Calculate pain for put options at this strike
-                    put_pain = sum(max(0, k - current_price) * oi for k, oi in 
-                                 zip(puts_df['strike'], puts_df['openInterest']) if k >= strike)
-                    
-                    total_pain = call_pain + put_pain
-                    pain_values.append((strike, total_pain))
+                strikes, pain = _calculate_max_pain(call_aggs, put_aggs)
                 
                 # Find the strike with minimum pain
-                max_pain_strike = min(pain_values, key=lambda x: x[1])[0]
+                max_pain_strike = strikes[pain.argmin()]
                 
                 # Display max pain
                 col1, col2 = st.columns(2)
@@ -512,17 +569,16 @@ def show_options_analysis():
                     )
                 
                 with col2:
-                    # Create DataFrame for plotting
-                    pain_df = pd.DataFrame(pain_values, columns=['Strike', 'Pain'])
-                    
-                    fig = px.line(
-                        pain_df, 
-                        x='Strike', 
-                        y='Pain',
-                        title='Option Pain by Strike Price',
-                        labels={'Strike': 'Strike Price (₹)', 'Pain': 'Total Pain Value'},
-                        markers=True
-                    )
+                    fig = go.Figure({
+                        'data': [{'type': 'scatter', 'mode': 'lines+markers', 'x': strikes, 'y': pain}],
+                        'layout': {
+                            **_BASE_LAYOUT,
+                            'height': 300,
+                            'title': {'text': 'Option Pain by Strike Price'},
+                            'xaxis': {'title': {'text': 'Strike Price (₹)'}},
+                            'yaxis': {'title': {'text': 'Total Pain Value'}}
+                        }
+                    })
                     
                     # Add vertical lines for max pain and current price
                     fig.add_vline(
@@ -541,7 +597,6 @@ def show_options_analysis():
                         annotation_position="top left"
                     )
                     
-                    fig.update_layout(height=300)
                     st.plotly_chart(fig, use_container_width=True)
             
             # Put/Call Ratio Analysis
@@ -552,221 +607,99 @@ def show_options_analysis():
             - Low ratio (<1): More calls than puts, suggesting bullish sentiment
             """)
             
-            if not calls_df.empty and not puts_df.empty:
-                total_call_volume = calls_df['volume'].sum() if 'volume' in calls_df.columns else 0
-                total_put_volume = puts_df['volume'].sum() if 'volume' in puts_df.columns else 0
+            if call_aggs['strike'].size > 0 and put_aggs['strike'].size > 0:
+                total_call_volume = call_aggs['total_volume']
+                total_put_volume = put_aggs['total_volume']
                 
-                total_call_oi = calls_df['openInterest'].sum() if 'openInterest' in calls_df.columns else 0
-                total_put_oi = puts_df['openInterest'].sum() if 'openInterest' in puts_df.columns else 0
+                total_call_oi = call_aggs['total_oi']
+                total_put_oi = put_aggs['total_oi']
                 
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     # Volume-based P/C ratio
                     if total_call_volume > 0:
-                        volume_pc_ratio = total_put_volume / total_call_volume
-                        
-                        # Determine sentiment based on ratio
-                        if volume_pc_ratio > 1.2:
-                            sentiment = "Bearish"
-                            color = "red"
-                        elif volume_pc_ratio < 0.8:
-                            sentiment = "Bullish"
-                            color = "green"
-                        else:
-                            sentiment = "Neutral"
-                            color = "orange"
-                        
-                        st.markdown(f"""
-                        <div style="border: 1px solid {color}; border-radius: 5px; padding: 10px; text-align: center;">
-                            <h3>Volume Put/Call Ratio</h3>
-                            <p style="font-size: 24px; color: {color};">{volume_pc_ratio:.2f}</p>
-                            <p>Market Sentiment: <strong style="color: {color};">{sentiment}</strong></p>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        _show_pc_ratio("Volume Put/Call Ratio", total_put_volume / total_call_volume)
                     else:
                         st.info("Insufficient volume data to calculate Put/Call ratio")
                 
                 with col2:
                     # Open Interest-based P/C ratio
                     if total_call_oi > 0:
-                        oi_pc_ratio = total_put_oi / total_call_oi
-                        
-                        # Determine sentiment based on ratio
-                        if oi_pc_ratio > 1.2:
-                            sentiment = "Bearish"
-                            color = "red"
-                        elif oi_pc_ratio < 0.8:
-                            sentiment = "Bullish"
-                            color = "green"
-                        else:
-                            sentiment = "Neutral"
-                            color = "orange"
-                        
-                        st.markdown(f"""
-                        <div style="border: 1px solid {color}; border-radius: 5px; padding: 10px; text-align: center;">
-                            <h3>Open Interest Put/Call Ratio</h3>
-                            <p style="font-size: 24px; color: {color};">{oi_pc_ratio:.2f}</p>
-                            <p>Market Sentiment: <strong style="color: {color};">{sentiment}</strong></p>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        _show_pc_ratio("Open Interest Put/Call Ratio", total_put_oi / total_call_oi)
                     else:
                         st.info("Insufficient open interest data to calculate Put/Call ratio")
         else:
             st.info("Current price information is not available for detailed analysis")
-            
+
+@st.cache_resource(show_spinner=False)
+def _build_payoff_fig(strategy):
+    """
+    Payoff diagram opened on a strategy, built once and shared read-only across sessions
+    
+    Every strategy's curve is included as a hidden trace behind a dropdown, so other
+    payoffs can be compared in the browser without a rerun.
+    """
+    names = list(_PAYOFF_Y)
+    
+    return go.Figure({
+        'data': [{
+            'type': 'scattergl',
+            'mode': 'lines',
+            'name': name,
+            'visible': name == strategy,
+            'x': _PAYOFF_X,  # Range from -10% to +10% of base price
+            'y': payoff
+        } for name, payoff in _PAYOFF_Y.items()],
+        'layout': {
+            'height': 400,
+            'margin': {'l': 0, 'r': 0, 't': 40, 'b': 0},
+            'showlegend': False,
+            'title': {'text': f"{strategy} Payoff Diagram"},
+            'xaxis': {'title': {'text': "Stock Price (%)"}, 'tickmode': 'linear', 'tick0': 90, 'dtick': 5},
+            'yaxis': {'title': {'text': "Profit/Loss"}, 'tickmode': 'linear', 'tick0': -10, 'dtick': 5},
+            # Reference lines at breakeven (y=0) and the current price (x=100)
+            'shapes': [
+                {'type': 'line', 'xref': 'x domain', 'x0': 0, 'x1': 1, 'y0': 0, 'y1': 0,
+                 'line': {'dash': 'dash', 'color': 'gray'}},
+                {'type': 'line', 'yref': 'y domain', 'x0': 100, 'x1': 100, 'y0': 0, 'y1': 1,
+                 'line': {'dash': 'dash', 'color': 'gray'}}
+            ],
+            'updatemenus': [{
+                'type': 'dropdown',
+                'active': names.index(strategy),
+                'x': 1, 'xanchor': 'right',
+                'y': 1, 'yanchor': 'bottom',
+                'buttons': [{
+                    'label': name,
+                    'method': 'update',
+                    'args': [
+                        {'visible': [other == name for other in names]},
+                        {'title.text': f"{name} Payoff Diagram"}
+                    ]
+                } for name in names]
+            }]
+        }
+    })
+
+@st.fragment
+def show_option_strategies():
+    """Display explanations and payoff diagrams for common option strategies"""
     
     # Display option strategies
     st.markdown("### Common Option Strategies")
     
     strategy = st.selectbox(
         "Select a strategy to learn more",
-        [
-            "Select a strategy",
-            "Covered Call",
-            "Protective Put",
-            "Bull Call Spread",
-            "Bear Put Spread",
-            "Straddle",
-            "Strangle"
-        ]
+        ["Select a strategy", *STRATEGY_INFO]
     )
     
     if strategy != "Select a strategy":
         # Display strategy information
-        strategy_info = {
-            "Covered Call": {
-                "description": "A strategy where you own the underlying stock and sell a call option against it.",
-                "use_case": "When you expect the stock to remain flat or rise slightly.",
-                "risk": "Limited upside potential, but reduced cost basis.",
-                "example": "Buy 100 shares of Reliance and sell 1 OTM call option."
-            },
-            "Protective Put": {
-                "description": "A strategy where you own the underlying stock and buy a put option to protect against downside.",
-                "use_case": "When you want to protect against a significant downside move.",
-                "risk": "Cost of the put option (premium).",
-                "example": "Buy 100 shares of HDFC Bank and buy 1 put option at or near the current price."
-            },
-            "Bull Call Spread": {
-                "description": "Buy a call option and sell a higher strike call option with the same expiration.",
-                "use_case": "When you expect a moderate rise in the stock or index.",
-                "risk": "Limited to the net premium paid.",
-                "example": "Buy NIFTY 22000 call and sell NIFTY 22500 call."
-            },
-            "Bear Put Spread": {
-                "description": "Buy a put option and sell a lower strike put option with the same expiration.",
-                "use_case": "When you expect a moderate decline in the stock or index.",
-                "risk": "Limited to the net premium paid.",
-                "example": "Buy NIFTY 22000 put and sell NIFTY 21500 put."
-            },
-            "Straddle": {
-                "description": "Buy a call and a put at the same strike price and expiration.",
-                "use_case": "When you expect a large move but are uncertain of the direction.",
-                "risk": "Limited to the combined premium paid for both options.",
-                "example": "Buy both a NIFTY 22000 call and a NIFTY 22000 put."
-            },
-            "Strangle": {
-                "description": "Buy a call with a higher strike price and a put with a lower strike price, same expiration.",
-                "use_case": "When you expect a large move but are uncertain of the direction, and want to reduce cost.",
-                "risk": "Limited to the combined premium paid for both options.",
-                "example": "Buy a NIFTY 22500 call and a NIFTY 21500 put."
-            }
-        }
-        
-        info = strategy_info[strategy]
-        
-        st.markdown(f"""
-        ### {strategy}
-        
-        **Description:** {info['description']}
-        
-        **Use Case:** {info['use_case']}
-        
-        **Risk Profile:** {info['risk']}
-        
-        **Example:** {info['example']}
-        """)
+        st.markdown(_STRATEGY_MARKDOWN[strategy])
         
         # Simple visual representation of the strategy's payoff
         st.markdown("#### Visual Payoff at Expiration")
         
-        # Generate a simple payoff graph based on the strategy
-        x = list(range(90, 111))  # Range from -10% to +10% of base price
-        fig = None
-        
-        if strategy == "Covered Call":
-            # Covered call payoff
-            y = [min(10, val - 90) for val in x]
-            fig = px.line(
-                x=x, 
-                y=y, 
-                labels={"x": "Stock Price (%)", "y": "Profit/Loss"},
-                title="Covered Call Payoff Diagram"
-            )
-            
-        elif strategy == "Protective Put":
-            # Protective put payoff
-            y = [max(val - 100, 0) - 2 for val in x]
-            fig = px.line(
-                x=x, 
-                y=y, 
-                labels={"x": "Stock Price (%)", "y": "Profit/Loss"},
-                title="Protective Put Payoff Diagram"
-            )
-            
-        elif strategy == "Bull Call Spread":
-            # Bull call spread payoff
-            y = [max(min(val - 95, 5), -2) for val in x]
-            fig = px.line(
-                x=x, 
-                y=y, 
-                labels={"x": "Stock Price (%)", "y": "Profit/Loss"},
-                title="Bull Call Spread Payoff Diagram"
-            )
-            
-        elif strategy == "Bear Put Spread":
-            # Bear put spread payoff
-            y = [max(min(105 - val, 5), -2) for val in x]
-            fig = px.line(
-                x=x, 
-                y=y, 
-                labels={"x": "Stock Price (%)", "y": "Profit/Loss"},
-                title="Bear Put Spread Payoff Diagram"
-            )
-            
-        elif strategy == "Straddle":
-            # Straddle payoff
-            y = [max(abs(val - 100) - 5, -5) for val in x]
-            fig = px.line(
-                x=x, 
-                y=y, 
-                labels={"x": "Stock Price (%)", "y": "Profit/Loss"},
-                title="Straddle Payoff Diagram"
-            )
-            
-        elif strategy == "Strangle":
-            # Strangle payoff
-            y = [max(max(val - 105, 95 - val), -3) for val in x]
-            fig = px.line(
-                x=x, 
-                y=y, 
-                labels={"x": "Stock Price (%)", "y": "Profit/Loss"},
-                title="Strangle Payoff Diagram"
-            )
-        
-        # Display the payoff diagram if we have a figure
-        if fig is not None:
-            # Add reference line at y=0
-            fig.add_hline(y=0, line_dash="dash", line_color="gray")
-            
-            # Add reference line at x=100 (current price)
-            fig.add_vline(x=100, line_dash="dash", line_color="gray")
-            
-            fig.update_layout(
-                height=400,
-                margin=dict(l=0, r=0, t=40, b=0),
-                xaxis=dict(tickmode='linear', tick0=90, dtick=5),
-                yaxis=dict(tickmode='linear', tick0=-10, dtick=5)
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
\ No newline at end of file
+        # A stable key keeps one chart element that the frontend updates in place
+        st.plotly_chart(_build_payoff_fig(strategy), use_container_width=True, key="payoff_chart")
@@ -13,6 +13,392 @@ from utils.pattern_recognition import (
     predict_future_movement
 )
 
+# Display names for the candlestick pattern columns, in the order they are listed
+_PATTERN_LABELS = {
+    'BullishEngulfing': "Bullish Engulfing",
+    'BearishEngulfing': "Bearish Engulfing",
+    'Hammer': "Hammer",
+    'ShootingStar': "Shooting Star",
+    'Doji': "Doji"
+}
+
+# Indicator charts offered on the technical indicators tab
+_INDICATOR_OPTIONS = (
+    "Moving Averages",
+    "RSI",
+    "MACD",
+    "Bollinger Bands",
+    "Stochastic Oscillator"
+)
+
+# Line colour for each moving average on the moving averages chart
+_MA_COLORS = {
+    'MA5': '#FFC107',  # Yellow
+    'MA10': '#FF9800',  # Orange
+    'MA20': '#F44336',  # Red
+    'MA50': '#9C27B0',  # Purple
+    'MA200': '#000000'  # Black
+}
+
+# Background (RGB) and border colours for the indicator insight cards
+_INSIGHT_BG = {'green': '76, 175, 80', 'red': '244, 67, 54', 'orange': '255, 152, 0', 'blue': '33, 150, 243'}
+_INSIGHT_BORDER = {'green': '#4CAF50', 'red': '#F44336', 'orange': '#FF9800', 'blue': '#2196F3'}
+
+# Label, colour and explanation for each prediction band, from strongly bearish to strongly bullish
+_PREDICTION_BANDS = (
+    ("Strong Bearish Signal", "red",
+     "The model predicts a high probability of downward price movement in the near future."),
+    ("Moderate Bearish Signal", "lightcoral",
+     "The model predicts a moderate probability of downward price movement in the near future."),
+    ("Neutral Signal", "gray",
+     "The model does not predict a strong directional movement in the near future."),
+    ("Moderate Bullish Signal", "lightgreen",
+     "The model predicts a moderate probability of upward price movement in the near future."),
+    ("Strong Bullish Signal", "green",
+     "The model predicts a high probability of upward price movement in the near future.")
+)
+
+# Background RGB, border colour and heading colour of the prediction card for each band colour
+_BAND_STYLE = {
+    'green': ('76, 175, 80', '#4CAF50', '#2E7D32'),
+    'lightgreen': ('129, 199, 132', '#81C784', '#388E3C'),
+    'red': ('244, 67, 54', '#F44336', '#C62828'),
+    'lightcoral': ('239, 154, 154', '#EF9A9A', '#D32F2F'),
+    'gray': ('158, 158, 158', '#9E9E9E', '#616161')
+}
+
+# Marker style for each group of candlestick patterns on the price chart
+_MARKER_STYLES = {
+    'Bullish Pattern': dict(symbol='triangle-up', size=10, color='green'),
+    'Bearish Pattern': dict(symbol='triangle-down', size=10, color='red'),
+    'Doji': dict(symbol='circle', size=8, color='blue')
+}
+
+@st.cache_data(ttl=900, max_entries=64, show_spinner=False)
+def _cached_stock_data(ticker, period):
+    """Cached wrapper around get_stock_data"""
+    return get_stock_data(ticker, period=period)
+
+@st.cache_data(ttl=900, max_entries=64, show_spinner=False)
+def _cached_analysis(ticker, period):
+    """Technical indicators, candlestick patterns and chart patterns for a ticker and period"""
+    stock_data = _cached_stock_data(ticker, period)
+    
+    return (
+        calculate_technical_indicators(stock_data),
+        identify_candlestick_patterns(stock_data),
+        detect_chart_patterns(stock_data)
+    )
+
+# Longest series sent to the browser per chart; longer histories are thinned for display only
+_MAX_PLOT_POINTS = 800
+
+def _as_float32(df):
+    """Copy of a frame with its float64 columns narrowed to float32, which is plenty of precision for plotting"""
+    return df.astype({col: np.float32 for col in df.select_dtypes('float64').columns})
+
+def _decimate(df, max_points=_MAX_PLOT_POINTS):
+    """Every n-th row of a frame in float32, so that at most max_points rows are plotted"""
+    step = -(-len(df) // max_points)
+    return _as_float32(df if step <= 1 else df.iloc[::step])
+
+def _decimate_ohlc(df, max_points=_MAX_PLOT_POINTS):
+    """Merge consecutive candles into at most max_points float32 buckets, keeping each bucket's true high and low"""
+    step = -(-len(df) // max_points)
+    if step <= 1:
+        return _as_float32(df)
+    
+    ohlc = df.groupby(np.arange(len(df)) // step).agg(
+        {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+    )
+    ohlc.index = df.index[::step]
+    return _as_float32(ohlc)
+
+def _build_insights(indicators_data):
+    """Signals from the latest indicator values, as dicts with indicator, signal, description and color"""
+    
+    # Crossovers compare the latest bar with the previous one, so a single bar gives no signals
+    if len(indicators_data) < 2:
+        return []
+    
+    # Latest and previous bars, pulled out once for all the checks below
+    last = indicators_data.iloc[-1]
+    prev = indicators_data.iloc[-2]
+    
+    # Current values
+    current_rsi = last.get('RSI')
+    current_macd = last.get('MACD')
+    current_signal = last.get('MACD_Signal')
+    current_price = last['Close']
+    current_bb_upper = last.get('BB_Upper')
+    current_bb_lower = last.get('BB_Lower')
+    current_slowk = last.get('SlowK')
+    current_slowd = last.get('SlowD')
+    
+    # Insights
+    insights = []
+    
+    # RSI insights
+    if current_rsi is not None:
+        if current_rsi > 70:
+            insights.append({
+                'indicator': 'RSI',
+                'signal': 'Overbought',
+                'description': f'RSI is at {current_rsi:.2f}, indicating potential overbought conditions.',
+                'color': 'red'
+            })
+        elif current_rsi < 30:
+            insights.append({
+                'indicator': 'RSI',
+                'signal': 'Oversold',
+                'description': f'RSI is at {current_rsi:.2f}, indicating potential oversold conditions.',
+                'color': 'green'
+            })
+    
+    # MACD insights
+    if current_macd is not None and current_signal is not None:
+        bullish_cross, bearish_cross = _crossover(prev, last, 'MACD', 'MACD_Signal')
+    
+        if current_macd > current_signal:
+            if bullish_cross:
+                insights.append({
+                    'indicator': 'MACD',
+                    'signal': 'Bullish Crossover',
+                    'description': 'MACD line has crossed above the signal line, potentially indicating upward momentum.',
+                    'color': 'green'
+                })
+            else:
+                insights.append({
+                    'indicator': 'MACD',
+                    'signal': 'Bullish',
+                    'description': 'MACD line is above the signal line, potentially indicating upward momentum.',
+                    'color': 'green'
+                })
+        elif current_macd < current_signal:
+            if bearish_cross:
+                insights.append({
+                    'indicator': 'MACD',
+                    'signal': 'Bearish Crossover',
+                    'description': 'MACD line has crossed below the signal line, potentially indicating downward momentum.',
+                    'color': 'red'
+                })
+            else:
+                insights.append({
+                    'indicator': 'MACD',
+                    'signal': 'Bearish',
+                    'description': 'MACD line is below the signal line, potentially indicating downward momentum.',
+                    'color': 'red'
+                })
+    
+    # Bollinger Bands insights
+    if current_bb_upper is not None and current_bb_lower is not None:
+        if current_price >= current_bb_upper:
+            insights.append({
+                'indicator': 'Bollinger Bands',
+                'signal': 'Upper Band Touch',
+                'description': 'Price is at or above the upper Bollinger Band, indicating potential overbought conditions or strong upward momentum.',
+                'color': 'orange'
+            })
+        elif current_price <= current_bb_lower:
+            insights.append({
+                'indicator': 'Bollinger Bands',
+                'signal': 'Lower Band Touch',
+                'description': 'Price is at or below the lower Bollinger Band, indicating potential oversold conditions or strong downward momentum.',
+                'color': 'blue'
+            })
+    
+    # Stochastic Oscillator insights
+    if current_slowk is not None and current_slowd is not None:
+        bullish_cross, bearish_cross = _crossover(prev, last, 'SlowK', 'SlowD')
+    
+        if current_slowk > 80 and current_slowd > 80:
+            insights.append({
+                'indicator': 'Stochastic',
+                'signal': 'Overbought',
+                'description': 'Stochastic oscillator is in overbought territory, potentially indicating a reversal to the downside.',
+                'color': 'red'
+            })
+        elif current_slowk < 20 and current_slowd < 20:
+            insights.append({
+                'indicator': 'Stochastic',
+                'signal': 'Oversold',
+                'description': 'Stochastic oscillator is in oversold territory, potentially indicating a reversal to the upside.',
+                'color': 'green'
+            })
+        elif bullish_cross:
+            insights.append({
+                'indicator': 'Stochastic',
+                'signal': 'Bullish Crossover',
+                'description': '%K line has crossed above the %D line, potentially indicating upward momentum.',
+                'color': 'green'
+            })
+        elif bearish_cross:
+            insights.append({
+                'indicator': 'Stochastic',
+                'signal': 'Bearish Crossover',
+                'description': '%K line has crossed below the %D line, potentially indicating downward momentum.',
+                'color': 'red'
+            })
+    
+    return insights
+
+def _level_list(title, levels):
+    """Markdown heading followed by a numbered list of price levels"""
+    items = "\n".join(f"{i+1}. ₹{level:.2f}" for i, level in enumerate(levels))
+    return f"### {title}\n{items}"
+
+def _render_insight(insight):
+    """HTML card for one technical indicator insight"""
+    return (
+        f"<div style='background-color:rgba({_INSIGHT_BG[insight['color']]}, 0.1); padding:10px; border-left:3px solid {_INSIGHT_BORDER[insight['color']]}; margin-bottom:10px;'>"
+        f"<h4 style='margin:0;'>{insight['indicator']}: {insight['signal']}</h4>"
+        f"<p>{insight['description']}</p>"
+        f"</div>"
+    )
+
+def _level_trace(x0, x1, levels, color):
+    """Dotted horizontal lines at each price level, drawn as one gapped line trace"""
+    ys = np.repeat(np.asarray(levels, dtype=float), 3)
+    ys[2::3] = np.nan
+    
+    return go.Scatter(
+        x=[x0, x1, None] * len(levels),
+        y=ys,
+        mode='lines',
+        line=dict(color=color, width=1, dash='dot'),
+        hoverinfo='skip',
+        showlegend=False
+    )
+
+def _band_shapes(upper, lower):
+    """Dashed overbought/oversold reference lines spanning the full width of an oscillator chart"""
+    return [
+        dict(type="line", xref="x domain", x0=0, x1=1, y0=level, y1=level,
+             line=dict(color=color, width=1, dash="dash"))
+        for level, color in ((upper, "red"), (lower, "green"))
+    ]
+
+# train_pattern_recognition_model needs twice its 5-day prediction window of complete rows
+_MIN_TRAINING_ROWS = 10
+
+@st.cache_resource(ttl=900, show_spinner=False)
+def _cached_model(ticker, data_fingerprint, _indicators_data):
+    """
+    Pattern recognition model and its scaler (None for tree models), trained once per ticker and price history
+    
+    The indicator frame itself is not hashed; data_fingerprint identifies it instead.
+    """
+    return train_pattern_recognition_model(_indicators_data)
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _cached_prediction(ticker, data_fingerprint, feature_cols, _model, _scaler, _indicators_data):
+    """Upward-movement probability for the latest bar, computed once per trained model"""
+    X_last = np.ascontiguousarray(_indicators_data[feature_cols].iloc[[-1]].to_numpy(dtype=np.float32))
+    return predict_future_movement(_model, _scaler, X_last)
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _cached_importances(ticker, data_fingerprint, feature_cols, _model):
+    """The model's 10 most important features, most important first, computed once per trained model"""
+    importances = _model.feature_importances_
+    top = np.argsort(importances)[::-1][:10]
+    
+    return pd.DataFrame({
+        'Feature': np.asarray(feature_cols)[top],
+        'Importance': importances[top]
+    })
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _gauge_fig(prob):
+    """Gauge showing the probability of upward movement, shared read-only across sessions"""
+    prob_pct = prob * 100.0
+    
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=prob_pct,
+        title={'text': "Probability of Upward Movement"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 30], 'color': "red"},
+                {'range': [30, 70], 'color': "gray"},
+                {'range': [70, 100], 'color': "green"}
+            ],
+            'threshold': {
+                'line': {'color': "black", 'width': 4},
+                'thickness': 0.75,
+                'value': prob_pct
+            }
+        }
+    ))
+    
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20)
+    )
+    
+    return fig
+
+@st.cache_resource(ttl=900, show_spinner=False)
+def _importance_fig(ticker, data_fingerprint, feature_cols, _model):
+    """Bar chart of the model's top 10 features, built once per trained model"""
+    
+    # Top 10 features by importance
+    importance_df = _cached_importances(ticker, data_fingerprint, feature_cols, _model)
+    
+    # Plot feature importances
+    fig = px.bar(
+        importance_df,
+        x='Importance',
+        y='Feature',
+        orientation='h',
+        title='Top 10 Most Important Technical Indicators'
+    )
+    
+    fig.update_layout(
+        yaxis_title='',
+        xaxis_title='Relative Importance',
+        height=350,
+        margin=dict(l=0, r=0, t=30, b=0)
+    )
+    
+    return fig
+
+def _prediction_band(prob):
+    """Index into _PREDICTION_BANDS for one or many upward-movement probabilities"""
+    prob = np.asarray(prob)
+    return np.select(
+        [prob > 0.7, prob > 0.55, prob < 0.3, prob < 0.45],
+        [4, 3, 0, 1],
+        default=2
+    )
+
+def _crossover(prev, last, fast, slow):
+    """Whether the fast line crossed above or below the slow line between the previous and latest bar"""
+    return (
+        last[fast] > last[slow] and prev[fast] <= prev[slow],
+        last[fast] < last[slow] and prev[fast] >= prev[slow]
+    )
+
+def _col_bool(df, name):
+    """A pattern column as a boolean array, all False if the column is missing and NaN read as False"""
+    if name not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return df[name].to_numpy(dtype=bool, na_value=False)
+
+def _extract_markers(patterns_data):
+    """Dates and marker prices for each pattern group, taken from the pattern columns in one pass"""
+    bullish = _col_bool(patterns_data, 'BullishEngulfing') | _col_bool(patterns_data, 'Hammer')
+    bearish = _col_bool(patterns_data, 'BearishEngulfing') | _col_bool(patterns_data, 'ShootingStar')
+    doji = _col_bool(patterns_data, 'Doji')
+    low, high = patterns_data['Low'].to_numpy(), patterns_data['High'].to_numpy()
+    
+    return {
+        'Bullish Pattern': (patterns_data.index[bullish], low[bullish] * 0.99),  # Slightly below the candle
+        'Bearish Pattern': (patterns_data.index[bearish], high[bearish] * 1.01),  # Slightly above the candle
+        'Doji': (patterns_data.index[doji], high[doji] * 1.01)
+    }
+
 def show():
     """Display the pattern recognition page"""
     st.header("Pattern Recognition")
@@ -34,17 +420,11 @@ def show():
         )
     
     # Fetch stock data
-    stock_data = get_stock_data(ticker, period=time_period)
+    stock_data = _cached_stock_data(ticker, time_period)
     
     if stock_data is not None and not stock_data.empty:
-        # Calculate technical indicators
-        indicators_data = calculate_technical_indicators(stock_data)
-        
-        # Identify candlestick patterns
-        patterns_data = identify_candlestick_patterns(stock_data)
-        
-        # Detect chart patterns
-        chart_patterns = detect_chart_patterns(stock_data)
+        # Calculate technical indicators, candlestick patterns and chart patterns
+        indicators_data, patterns_data, chart_patterns = _cached_analysis(ticker, time_period)
         
         # Display candlestick chart with patterns
         st.subheader("Candlestick Chart & Patterns")
@@ -53,142 +433,67 @@ def show():
         tab1, tab2, tab3 = st.tabs(["Candlestick Patterns", "Technical Indicators", "ML Prediction"])
         
         with tab1:
-            # Create a candlestick chart with pattern markers
-            fig = go.Figure()
+            # Collect the candlestick chart traces, then build the figure once
+            traces = []
+            annotations = []
             
             # Check if data is available
             if patterns_data is not None and not patterns_data.empty:
+                candles = _decimate_ohlc(patterns_data)
+                
                 # Add candlestick chart
-                fig.add_trace(go.Candlestick(
-                    x=patterns_data.index,
-                    open=patterns_data['Open'],
-                    high=patterns_data['High'],
-                    low=patterns_data['Low'],
-                    close=patterns_data['Close'],
+                traces.append(go.Candlestick(
+                    x=candles.index,
+                    open=candles['Open'],
+                    high=candles['High'],
+                    low=candles['Low'],
+                    close=candles['Close'],
                     name='Price'
                 ))
                 
-                # Add markers for bullish patterns
-                bullish_markers = []
-                bullish_x = []
+                # Add markers for bullish, bearish and doji candles
+                for name, (marker_x, marker_y) in _extract_markers(patterns_data).items():
+                    if len(marker_x):
+                        traces.append(go.Scatter(
+                            x=marker_x,
+                            y=marker_y,
+                            mode='markers',
+                            marker=_MARKER_STYLES[name],
+                            name=name
+                        ))
                 
-                for i, row in patterns_data.iterrows():
-                    if row.get('BullishEngulfing', False) or row.get('Hammer', False):
-                        bullish_markers.append(row['Low'] * 0.99)  # Slightly below the candle
-                        bullish_x.append(i)
+                # Add volume as a subplot
+                traces.append(go.Bar(
+                    x=candles.index,
+                    y=candles['Volume'],
+                    name='Volume',
+                    marker=dict(color='rgba(0, 0, 0, 0.2)'),
+                    yaxis='y2'
+                ))
+                
+                # Add the top 3 support and resistance levels if available
+                for key, color in (('support_levels', 'green'), ('resistance_levels', 'red')):
+                    if chart_patterns.get(key):
+                        traces.append(_level_trace(
+                            patterns_data.index[0], patterns_data.index[-1], chart_patterns[key][:3], color
+                        ))
             else:
-                # Add empty trace with a message
-                fig.add_annotation(
+                # Show a message instead of the chart
+                annotations.append(dict(
                     x=0.5, y=0.5,
                     text="No pattern data available",
                     showarrow=False,
                     font=dict(size=20)
-                )
-            
-            if bullish_markers:
-                fig.add_trace(go.Scatter(
-                    x=bullish_x,
-                    y=bullish_markers,
-                    mode='markers',
-                    marker=dict(
-                        symbol='triangle-up',
-                        size=10,
-                        color='green'
-                    ),
-                    name='Bullish Pattern'
-                ))
-            
-            # Add markers for bearish patterns
-            bearish_markers = []
-            bearish_x = []
-            
-            for i, row in patterns_data.iterrows():
-                if row['BearishEngulfing'] or row['ShootingStar']:
-                    bearish_markers.append(row['High'] * 1.01)  # Slightly above the candle
-                    bearish_x.append(i)
-            
-            if bearish_markers:
-                fig.add_trace(go.Scatter(
-                    x=bearish_x,
-                    y=bearish_markers,
-                    mode='markers',
-                    marker=dict(
-                        symbol='triangle-down',
-                        size=10,
-                        color='red'
-                    ),
-                    name='Bearish Pattern'
                 ))
             
-            # Add markers for doji
-            doji_markers = []
-            doji_x = []
-            
-            for i, row in patterns_data.iterrows():
-                if row['Doji']:
-                    doji_markers.append(row['High'] * 1.01)  # Slightly above the candle
-                    doji_x.append(i)
-            
-            if doji_markers:
-                fig.add_trace(go.Scatter(
-                    x=doji_x,
-                    y=doji_markers,
-                    mode='markers',
-                    marker=dict(
-                        symbol='circle',
-                        size=8,
-                        color='blue'
-                    ),
-                    name='Doji'
-                ))
-            
-            # Add volume as a subplot
-            fig.add_trace(go.Bar(
-                x=patterns_data.index,
-                y=patterns_data['Volume'],
-                name='Volume',
-                marker=dict(color='rgba(0, 0, 0, 0.2)'),
-                yaxis='y2'
-            ))
-            
-            # Add support and resistance levels if available
-            if 'support_levels' in chart_patterns and chart_patterns['support_levels']:
-                for level in chart_patterns['support_levels'][:3]:  # Show top 3 levels
-                    fig.add_shape(
-                        type="line",
-                        x0=patterns_data.index[0],
-                        y0=level,
-                        x1=patterns_data.index[-1],
-                        y1=level,
-                        line=dict(
-                            color="green",
-                            width=1,
-                            dash="dot",
-                        )
-                    )
-            
-            if 'resistance_levels' in chart_patterns and chart_patterns['resistance_levels']:
-                for level in chart_patterns['resistance_levels'][:3]:  # Show top 3 levels
-                    fig.add_shape(
-                        type="line",
-                        x0=patterns_data.index[0],
-                        y0=level,
-                        x1=patterns_data.index[-1],
-                        y1=level,
-                        line=dict(
-                            color="red",
-                            width=1,
-                            dash="dot",
-                        )
-                    )
-            
+            fig = go.Figure(data=traces)
             fig.update_layout(
+                annotations=annotations,
                 title=f"{ticker} Candlestick Chart with Pattern Recognition",
                 xaxis_title='Date',
                 yaxis_title='Price (₹)',
                 yaxis2=dict(
-                    title='Volume',
-                    titlefont=dict(color='rgba(0, 0, 0, 0.5)'),
+                    title=dict(text='Volume', font=dict(color='rgba(0, 0, 0, 0.5)')),
                     tickfont=dict(color='rgba(0, 0, 0, 0.5)'),
                     overlaying='y',
                     side='right',
@@ -227,14 +532,10 @@ def show():
                 resistance_levels = chart_patterns.get('resistance_levels', [])
                 
                 if support_levels:
-                    st.markdown("### Support Levels")
-                    for i, level in enumerate(support_levels[:3]):
-                        st.markdown(f"{i+1}. ₹{level:.2f}")
+                    st.markdown(_level_list("Support Levels", support_levels[:3]))
                 
                 if resistance_levels:
-                    st.markdown("### Resistance Levels")
-                    for i, level in enumerate(resistance_levels[:3]):
-                        st.markdown(f"{i+1}. ₹{level:.2f}")
+                    st.markdown(_level_list("Resistance Levels", resistance_levels[:3]))
             
             with col2:
                 # Display additional pattern information
@@ -266,26 +567,15 @@ def show():
                 lookback_days = min(30, len(patterns_data))
                 recent_data = patterns_data.iloc[-lookback_days:]
                 
-                bullish_engulfing_count = recent_data['BullishEngulfing'].sum()
-                bearish_engulfing_count = recent_data['BearishEngulfing'].sum()
-                hammer_count = recent_data['Hammer'].sum()
-                shooting_star_count = recent_data['ShootingStar'].sum()
-                doji_count = recent_data['Doji'].sum()
+                counts = recent_data[list(_PATTERN_LABELS)].to_numpy().sum(axis=0)
+                pattern_counts = dict(zip(_PATTERN_LABELS.values(), counts.astype(int).tolist()))
                 
-                pattern_counts = {
-                    "Bullish Engulfing": int(bullish_engulfing_count),
-                    "Bearish Engulfing": int(bearish_engulfing_count),
-                    "Hammer": int(hammer_count),
-                    "Shooting Star": int(shooting_star_count),
-                    "Doji": int(doji_count)
-                }
+                pattern_lines = [f"- {pattern}: {count} instances" for pattern, count in pattern_counts.items() if count > 0]
                 
-                for pattern, count in pattern_counts.items():
-                    if count > 0:
-                        st.markdown(f"- {pattern}: {count} instances")
-                    
-                # If no patterns detected
-                if sum(pattern_counts.values()) == 0:
+                if pattern_lines:
+                    st.markdown("\n".join(pattern_lines))
+                else:
+                    # If no patterns detected
                     st.markdown("No significant candlestick patterns detected in recent data.")
         
         with tab2:
@@ -294,53 +584,40 @@ def show():
                 st.subheader("Technical Indicators")
                 
                 # Create indicator selection
-                indicator_options = [
-                    "Moving Averages",
-                    "RSI",
-                    "MACD",
-                    "Bollinger Bands",
-                    "Stochastic Oscillator"
-                ]
-                
                 selected_indicators = st.multiselect(
                     "Select Technical Indicators",
-                    options=indicator_options,
+                    options=_INDICATOR_OPTIONS,
                     default=["Moving Averages", "RSI"]
                 )
                 
-                # Plot selected indicators
+                # Plot selected indicators, thinned for long histories
+                plot_data = _decimate(indicators_data)
+                
                 if "Moving Averages" in selected_indicators:
                     # Moving Averages chart
-                    fig = go.Figure()
+                    traces = []
                     
                     # Add price
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['Close'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['Close'],
                         mode='lines',
                         name='Close Price',
                         line=dict(color='#1E88E5', width=2)
                     ))
                     
                     # Add moving averages
-                    ma_colors = {
-                        'MA5': '#FFC107',  # Yellow
-                        'MA10': '#FF9800',  # Orange
-                        'MA20': '#F44336',  # Red
-                        'MA50': '#9C27B0',  # Purple
-                        'MA200': '#000000'  # Black
-                    }
-                    
-                    for ma, color in ma_colors.items():
-                        if ma in indicators_data.columns:
-                            fig.add_trace(go.Scatter(
-                                x=indicators_data.index,
-                                y=indicators_data[ma],
+                    for ma, color in _MA_COLORS.items():
+                        if ma in plot_data.columns:
+                            traces.append(go.Scatter(
+                                x=plot_data.index,
+                                y=plot_data[ma],
                                 mode='lines',
                                 name=ma,
                                 line=dict(color=color, width=1)
                             ))
                     
+                    fig = go.Figure(data=traces)
                     fig.update_layout(
                         title='Moving Averages',
                         xaxis_title='Date',
@@ -354,48 +631,23 @@ def show():
                 
                 if "RSI" in selected_indicators:
                     # RSI chart
-                    fig = go.Figure()
+                    traces = []
                     
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['RSI'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['RSI'],
                         mode='lines',
                         name='RSI',
                         line=dict(color='#2196F3', width=2)
                     ))
                     
-                    # Add overbought/oversold lines
-                    fig.add_shape(
-                        type="line",
-                        x0=indicators_data.index[0],
-                        y0=70,
-                        x1=indicators_data.index[-1],
-                        y1=70,
-                        line=dict(
-                            color="red",
-                            width=1,
-                            dash="dash",
-                        )
-                    )
-                    
-                    fig.add_shape(
-                        type="line",
-                        x0=indicators_data.index[0],
-                        y0=30,
-                        x1=indicators_data.index[-1],
-                        y1=30,
-                        line=dict(
-                            color="green",
-                            width=1,
-                            dash="dash",
-                        )
-                    )
-                    
+                    fig = go.Figure(data=traces)
                     fig.update_layout(
                         title='Relative Strength Index (RSI)',
                         xaxis_title='Date',
                         yaxis_title='RSI',
                         yaxis=dict(range=[0, 100]),
+                        shapes=_band_shapes(70, 30),  # Overbought/oversold lines
                         height=300,
                         margin=dict(l=0, r=0, t=30, b=0)
                     )
@@ -404,34 +656,35 @@ def show():
                 
                 if "MACD" in selected_indicators:
                     # MACD chart
-                    fig = go.Figure()
+                    traces = []
                     
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['MACD'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['MACD'],
                         mode='lines',
                         name='MACD',
                         line=dict(color='#2196F3', width=2)
                     ))
                     
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['MACD_Signal'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['MACD_Signal'],
                         mode='lines',
                         name='Signal Line',
                         line=dict(color='#FF9800', width=1)
                     ))
                     
                     # Add histogram
-                    colors = ['green' if val >= 0 else 'red' for val in indicators_data['MACD_Hist']]
+                    colors = np.where(plot_data['MACD_Hist'].to_numpy() >= 0, 'green', 'red')
                     
-                    fig.add_trace(go.Bar(
-                        x=indicators_data.index,
-                        y=indicators_data['MACD_Hist'],
+                    traces.append(go.Bar(
+                        x=plot_data.index,
+                        y=plot_data['MACD_Hist'],
                         name='Histogram',
                         marker_color=colors
                     ))
                     
+                    fig = go.Figure(data=traces)
                     fig.update_layout(
                         title='MACD (Moving Average Convergence Divergence)',
                         xaxis_title='Date',
@@ -444,37 +697,37 @@ def show():
                 
                 if "Bollinger Bands" in selected_indicators:
                     # Bollinger Bands chart
-                    fig = go.Figure()
+                    traces = []
                     
                     # Add price
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['Close'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['Close'],
                         mode='lines',
                         name='Close Price',
                         line=dict(color='#1E88E5', width=2)
                     ))
                     
                     # Add Bollinger Bands
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['BB_Upper'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['BB_Upper'],
                         mode='lines',
                         name='Upper Band',
                         line=dict(color='rgba(244, 67, 54, 0.7)', width=1)
                     ))
                     
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['BB_Middle'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['BB_Middle'],
                         mode='lines',
                         name='Middle Band',
                         line=dict(color='rgba(0, 0, 0, 0.5)', width=1)
                     ))
                     
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['BB_Lower'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['BB_Lower'],
                         mode='lines',
                         name='Lower Band',
                         line=dict(color='rgba(76, 175, 80, 0.7)', width=1),
@@ -482,6 +735,7 @@ def show():
                         fillcolor='rgba(0, 0, 0, 0.05)'
                     ))
                     
+                    fig = go.Figure(data=traces)
                     fig.update_layout(
                         title='Bollinger Bands',
                         xaxis_title='Date',
@@ -495,56 +749,31 @@ def show():
                 
                 if "Stochastic Oscillator" in selected_indicators:
                     # Stochastic Oscillator chart
-                    fig = go.Figure()
+                    traces = []
                     
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['SlowK'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['SlowK'],
                         mode='lines',
                         name='%K',
                         line=dict(color='#2196F3', width=2)
                     ))
                     
-                    fig.add_trace(go.Scatter(
-                        x=indicators_data.index,
-                        y=indicators_data['SlowD'],
+                    traces.append(go.Scatter(
+                        x=plot_data.index,
+                        y=plot_data['SlowD'],
                         mode='lines',
                         name='%D',
                         line=dict(color='#FF9800', width=1)
                     ))
                     
-                    # Add overbought/oversold lines
-                    fig.add_shape(
-                        type="line",
-                        x0=indicators_data.index[0],
-                        y0=80,
-                        x1=indicators_data.index[-1],
-                        y1=80,
-                        line=dict(
-                            color="red",
-                            width=1,
-                            dash="dash",
-                        )
-                    )
-                    
-                    fig.add_shape(
-                        type="line",
-                        x0=indicators_data.index[0],
-                        y0=20,
-                        x1=indicators_data.index[-1],
-                        y1=20,
-                        line=dict(
-                            color="green",
-                            width=1,
-                            dash="dash",
-                        )
-                    )
-                    
+                    fig = go.Figure(data=traces)
                     fig.update_layout(
                         title='Stochastic Oscillator',
                         xaxis_title='Date',
                         yaxis_title='Value',
                         yaxis=dict(range=[0, 100]),
+                        shapes=_band_shapes(80, 20),  # Overbought/oversold lines
                         height=300,
                         margin=dict(l=0, r=0, t=30, b=0)
                     )
@@ -554,127 +783,11 @@ def show():
                 # Display key insights based on indicators
                 st.subheader("Technical Indicator Insights")
                 
-                # Current values
-                current_rsi = indicators_data['RSI'].iloc[-1] if 'RSI' in indicators_data.columns else None
-                current_macd = indicators_data['MACD'].iloc[-1] if 'MACD' in indicators_data.columns else None
-                current_signal = indicators_data['MACD_Signal'].iloc[-1] if 'MACD_Signal' in indicators_data.columns else None
-                current_price = indicators_data['Close'].iloc[-1]
-                current_bb_upper = indicators_data['BB_Upper'].iloc[-1] if 'BB_Upper' in indicators_data.columns else None
-                current_bb_lower = indicators_data['BB_Lower'].iloc[-1] if 'BB_Lower' in indicators_data.columns else None
-                current_slowk = indicators_data['SlowK'].iloc[-1] if 'SlowK' in indicators_data.columns else None
-                current_slowd = indicators_data['SlowD'].iloc[-1] if 'SlowD' in indicators_data.columns else None
-                
-                # Insights
-                insights = []
-                
-                # RSI insights
-                if current_rsi is not None:
-                    if current_rsi > 70:
-                        insights.append({
-                            'indicator': 'RSI',
-                            'signal': 'Overbought',
-                            'description': f'RSI is at {current_rsi:.2f}, indicating potential overbought conditions.',
-                            'color': 'red'
-                        })
-                    elif current_rsi < 30:
-                        insights.append({
-                            'indicator': 'RSI',
-                            'signal': 'Oversold',
-                            'description': f'RSI is at {current_rsi:.2f}, indicating potential oversold conditions.',
-                            'color': 'green'
-                        })
-                
-                # MACD insights
-                if current_macd is not None and current_signal is not None:
-                    if current_macd > current_signal:
-                        if indicators_data['MACD'].iloc[-2] <= indicators_data['MACD_Signal'].iloc[-2]:
-                            insights.append({
-                                'indicator': 'MACD',
-                                'signal': 'Bullish Crossover',
-                                'description': 'MACD line has crossed above the signal line, potentially indicating upward momentum.',
-                                'color': 'green'
-                            })
-                        else:
-                            insights.append({
-                                'indicator': 'MACD',
-                                'signal': 'Bullish',
-                                'description': 'MACD line is above the signal line, potentially indicating upward momentum.',
-                                'color': 'green'
-                            })
-                    elif current_macd < current_signal:
-                        if indicators_data['MACD'].iloc[-2] >= indicators_data['MACD_Signal'].iloc[-2]:
-                            insights.append({
-                                'indicator': 'MACD',
-                                'signal': 'Bearish Crossover',
-                                'description': 'MACD line has crossed below the signal line, potentially indicating downward momentum.',
-                                'color': 'red'
-                            })
-                        else:
-                            insights.append({
-                                'indicator': 'MACD',
-                                'signal': 'Bearish',
-                                'description': 'MACD line is below the signal line, potentially indicating downward momentum.',
-                                'color': 'red'
-                            })
-                
-                # Bollinger Bands insights
-                if current_bb_upper is not None and current_bb_lower is not None:
-                    if current_price >= current_bb_upper:
-                        insights.append({
-                            'indicator': 'Bollinger Bands',
-                            'signal': 'Upper Band Touch',
-                            'description': 'Price is at or above the upper Bollinger Band, indicating potential overbought conditions or strong upward momentum.',
-                            'color': 'orange'
-                        })
-                    elif current_price <= current_bb_lower:
-                        insights.append({
-                            'indicator': 'Bollinger Bands',
-                            'signal': 'Lower Band Touch',
-                            'description': 'Price is at or below the lower Bollinger Band, indicating potential oversold conditions or strong downward momentum.',
-                            'color': 'blue'
-                        })
-                
-                # Stochastic Oscillator insights
-                if current_slowk is not None and current_slowd is not None:
-                    if current_slowk > 80 and current_slowd > 80:
-                        insights.append({
-                            'indicator': 'Stochastic',
-                            'signal': 'Overbought',
-                            'description': 'Stochastic oscillator is in overbought territory, potentially indicating a reversal to the downside.',
-                            'color': 'red'
-                        })
-                    elif current_slowk < 20 and current_slowd < 20:
-                        insights.append({
-                            'indicator': 'Stochastic',
-                            'signal': 'Oversold',
-                            'description': 'Stochastic oscillator is in oversold territory, potentially indicating a reversal to the upside.',
-                            'color': 'green'
-                        })
-                    elif current_slowk > current_slowd and indicators_data['SlowK'].iloc[-2] <= indicators_data['SlowD'].iloc[-2]:
-                        insights.append({
-                            'indicator': 'Stochastic',
-                            'signal': 'Bullish Crossover',
-                            'description': '%K line has crossed above the %D line, potentially indicating upward momentum.',
-                            'color': 'green'
-                        })
-                    elif current_slowk < current_slowd and indicators_data['SlowK'].iloc[-2] >= indicators_data['SlowD'].iloc[-2]:
-                        insights.append({
-                            'indicator': 'Stochastic',
-                            'signal': 'Bearish Crossover',
-                            'description': '%K line has crossed below the %D line, potentially indicating downward momentum.',
-                            'color': 'red'
-                        })
+                insights = _build_insights(indicators_data)
                 
                 # Display insights
                 if insights:
-                    for insight in insights:
-                        st.markdown(
-                            f"<div style='background-color:rgba({{'green': '76, 175, 80', 'red': '244, 67, 54', 'orange': '255, 152, 0', 'blue': '33, 150, 243'}}['{insight['color']}'], 0.1); padding:10px; border-left:3px solid {{'green': '#4CAF50', 'red': '#F44336', 'orange': '#FF9800', 'blue': '#2196F3'}}['{insight['color']}']; margin-bottom:10px;'>"
-                            f"<h4 style='margin:0;'>{insight['indicator']}: {insight['signal']}</h4>"
-                            f"<p>{insight['description']}</p>"
-                            f"</div>",
-                            unsafe_allow_html=True
-                        )
+                    st.markdown("".join(_render_insight(insight) for insight in insights), unsafe_allow_html=True)
                 else:
                     st.info("No significant technical signals detected in the current data.")
             else:
@@ -693,75 +806,39 @@ def show():
                 ]
                 
                 # Make sure all required features are present
-                for feature in feature_cols:
-                    if feature not in indicators_data.columns:
-                        st.warning(f"Missing feature: {feature}. Cannot perform ML prediction.")
-                        break
+                missing_features = [feature for feature in feature_cols if feature not in indicators_data.columns]
+                
+                if missing_features:
+                    st.warning(f"Missing features: {', '.join(missing_features)}. Cannot perform ML prediction.")
+                elif indicators_data.notna().all(axis=1).sum() < _MIN_TRAINING_ROWS:
+                    # Training drops incomplete rows, so skip it when too few would survive
+                    st.warning("Unable to train prediction model. Not enough data or too many missing values.")
                 else:
                     # All features are present, continue with training
                     with st.spinner("Training pattern recognition model..."):
-                        model, scaler = train_pattern_recognition_model(indicators_data)
+                        # Length, last date and last close identify the history the model is trained on
+                        data_fingerprint = (len(indicators_data), indicators_data.index[-1], float(indicators_data['Close'].iloc[-1]))
+                        model, scaler = _cached_model(ticker, data_fingerprint, indicators_data)
                         
-                        if model is not None and scaler is not None:
+                        if model is not None:
                             # Make prediction
-                            prediction_prob = predict_future_movement(model, scaler, indicators_data, feature_cols)
+                            prediction_prob = _cached_prediction(ticker, data_fingerprint, feature_cols, model, scaler, indicators_data)
                             
                             # Display prediction
                             st.subheader("Price Movement Prediction")
                             
                             # Create a gauge chart for prediction probability
-                            fig = go.Figure(go.Indicator(
-                                mode="gauge+number",
-                                value=prediction_prob * 100,
-                                title={'text': "Probability of Upward Movement"},
-                                gauge={
-                                    'axis': {'range': [0, 100]},
-                                    'bar': {'color': "darkblue"},
-                                    'steps': [
-                                        {'range': [0, 30], 'color': "red"},
-                                        {'range': [30, 70], 'color': "gray"},
-                                        {'range': [70, 100], 'color': "green"}
-                                    ],
-                                    'threshold': {
-                                        'line': {'color': "black", 'width': 4},
-                                        'thickness': 0.75,
-                                        'value': prediction_prob * 100
-                                    }
-                                }
-                            ))
-                            
-                            fig.update_layout(
-                                height=300,
-                                margin=dict(l=20, r=20, t=50, b=20)
-                            )
+                            fig = _gauge_fig(round(prediction_prob, 3))
                             
                             st.plotly_chart(fig, use_container_width=True)
                             
                             # Prediction interpretation
-                            if prediction_prob > 0.7:
-                                prediction_text = "Strong Bullish Signal"
-                                prediction_color = "green"
-                                prediction_description = "The model predicts a high probability of upward price movement in the near future."
-                            elif prediction_prob > 0.55:
-                                prediction_text = "Moderate Bullish Signal"
-                                prediction_color = "lightgreen"
-                                prediction_description = "The model predicts a moderate probability of upward price movement in the near future."
-                            elif prediction_prob < 0.3:
-                                prediction_text = "Strong Bearish Signal"
-                                prediction_color = "red"
-                                prediction_description = "The model predicts a high probability of downward price movement in the near future."
-                            elif prediction_prob < 0.45:
-                                prediction_text = "Moderate Bearish Signal"
-                                prediction_color = "lightcoral"
-                                prediction_description = "The model predicts a moderate probability of downward price movement in the near future."
-                            else:
-                                prediction_text = "Neutral Signal"
-                                prediction_color = "gray"
-                                prediction_description = "The model does not predict a strong directional movement in the near future."
+                            prediction_text, prediction_color, prediction_description = _PREDICTION_BANDS[int(_prediction_band(prediction_prob))]
+                            card_rgb, card_border, card_heading = _BAND_STYLE[prediction_color]
                             
                             st.markdown(
-                                f"<div style='background-color:rgba({{'green': '76, 175, 80', 'lightgreen': '129, 199, 132', 'red': '244, 67, 54', 'lightcoral': '239, 154, 154', 'gray': '158, 158, 158'}}['{prediction_color}'], 0.1); padding:15px; border-left:3px solid {{'green': '#4CAF50', 'lightgreen': '#81C784', 'red': '#F44336', 'lightcoral': '#EF9A9A', 'gray': '#9E9E9E'}}['{prediction_color}']'>"
-                                f"<h3 style='margin:0; color:{{'green': '#2E7D32', 'lightgreen': '#388E3C', 'red': '#C62828', 'lightcoral': '#D32F2F', 'gray': '#616161'}}['{prediction_color}'];'>{prediction_text}</h3>"
+                                f"<div style='background-color:rgba({card_rgb}, 0.1); padding:15px; border-left:3px solid {card_border}'>"
+                                f"<h3 style='margin:0; color:{card_heading};'>{prediction_text}</h3>"
                                 f"<p style='margin-top:10px;'>{prediction_description}</p>"
                                 f"<p style='margin-top:10px;'><b>Prediction score:</b> {prediction_prob:.2f} (on a scale of 0 to 1)</p>"
                                 f"<p style='font-size:0.8em; color:gray; margin-top:10px;'>Note: This prediction is based on historical patterns and technical indicators. It should not be considered as financial advice.</p>"
@@ -773,31 +850,7 @@ def show():
                             if hasattr(model, 'feature_importances_'):
                                 st.subheader("Feature Importance")
                                 
-                                # Get feature importances
-                                importances = model.feature_importances_
-                                indices = np.argsort(importances)[::-1]
-                                
-                                # Create a DataFrame for display
-                                importance_df = pd.DataFrame({
-                                    'Feature': [feature_cols[i] for i in indices],
-                                    'Importance': [importances[i] for i in indices]
-                                })
-                                
-                                # Plot feature importances
-                                fig = px.bar(
-                                    importance_df.head(10),  # Top 10 features
-                                    x='Importance',
-                                    y='Feature',
-                                    orientation='h',
-                                    title='Top 10 Most Important Technical Indicators'
-                                )
-                                
-                                fig.update_layout(
-                                    yaxis_title='',
-                                    xaxis_title='Relative Importance',
-                                    height=350,
-                                    margin=dict(l=0, r=0, t=30, b=0)
-                                )
+                                fig = _importance_fig(ticker, data_fingerprint, feature_cols, model)
                                 
                                 st.plotly_chart(fig, use_container_width=True)
                         else:
@@ -1,7 +1,6 @@
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.ensemble import RandomForestClassifier
+from numpy.lib.stride_tricks import sliding_window_view
 
 # Handle talib import - create a mock implementation since it's not available
 class TALib:
@@ -16,7 +15,7 @@ class TALib:
         avg_gain = gain.rolling(window=timeperiod).mean()
         avg_loss = loss.rolling(window=timeperiod).mean()
         rs = avg_gain / avg_loss
-        return 100 - (100 / (1 + rs))
+        return (100 - (100 / (1 + rs))).values
     
     @staticmethod
     def MACD(values, fastperiod=12, slowperiod=26, signalperiod=9):
@@ -63,8 +62,27 @@ class TALib:
         
         return -100 * ((high_roll - close_series) / (high_roll - low_roll)).values
 
-# Use our implementation
-ta = TALib()
+# Use the TA-Lib C library when it is installed, otherwise our implementation
+try:
+    import talib as ta
+except ImportError:
+    ta = TALib()
+
+def _rolling_means(values, windows):
+    """Simple moving averages of one series for several windows, all taken from a single cumulative sum"""
+    values = np.asarray(values, dtype=np.float64)
+    missing = np.isnan(values)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, values))))
+    nan_count = np.concatenate(([0], np.cumsum(missing)))
+    means = {}
+    for window in windows:
+        mean = np.full(len(values), np.nan)
+        if len(values) >= window:
+            # Like rolling().mean(), a window holding any NaN stays NaN
+            complete = nan_count[window:] == nan_count[:-window]
+            mean[window - 1:] = np.where(complete, (csum[window:] - csum[:-window]) / window, np.nan)
+        means[window] = mean
+    return means
 
 def calculate_technical_indicators(df):
     """
@@ -84,11 +102,8 @@ def calculate_technical_indicators(df):
     
     # Calculate basic technical indicators
     # Moving Averages
-    data['MA5'] = data['Close'].rolling(window=5).mean()
-    data['MA10'] = data['Close'].rolling(window=10).mean()
-    data['MA20'] = data['Close'].rolling(window=20).mean()
-    data['MA50'] = data['Close'].rolling(window=50).mean()
-    data['MA200'] = data['Close'].rolling(window=200).mean()
+    for window, mean in _rolling_means(data['Close'].to_numpy(), (5, 10, 20, 50, 200)).items():
+        data[f'MA{window}'] = mean
     
     # Relative Strength Index
     try:
@@ -193,16 +208,13 @@ def identify_candlestick_patterns(df):
     # Create a copy of the dataframe
     data = df.copy()
     
+    # Pull the price columns out once so every pattern test runs on plain arrays
+    open_, high, low, close = (data[col].to_numpy() for col in ('Open', 'High', 'Low', 'Close'))
+    
     # Calculate candlestick components
-    data['Body'] = abs(data['Open'] - data['Close'])
-    data['UpperShadow'] = data.apply(
-        lambda x: x['High'] - x['Close'] if x['Close'] > x['Open'] else x['High'] - x['Open'], 
-        axis=1
-    )
-    data['LowerShadow'] = data.apply(
-        lambda x: x['Close'] - x['Low'] if x['Close'] < x['Open'] else x['Open'] - x['Low'], 
-        axis=1
-    )
+    data['Body'] = np.abs(open_ - close)
+    data['UpperShadow'] = high - np.maximum(open_, close)
+    data['LowerShadow'] = np.minimum(open_, close) - low
     
     # Simple pattern detection (manual implementation)
     # Doji
@@ -218,25 +230,31 @@ def identify_candlestick_patterns(df):
                             (data['LowerShadow'] <= 0.1 * data['Body']) &
                             (data['Body'] > 0))
     
-    # Engulfing patterns
-    data['BullishEngulfing'] = False
-    data['BearishEngulfing'] = False
-    
-    for i in range(1, len(data)):
-        if (data['Close'].iloc[i] > data['Open'].iloc[i] and  # Current candle is bullish
-            data['Close'].iloc[i-1] < data['Open'].iloc[i-1] and  # Previous candle is bearish
-            data['Close'].iloc[i] > data['Open'].iloc[i-1] and  # Current close > previous open
-            data['Open'].iloc[i] < data['Close'].iloc[i-1]):  # Current open < previous close
-            data.loc[data.index[i], 'BullishEngulfing'] = True
-            
-        elif (data['Close'].iloc[i] < data['Open'].iloc[i] and  # Current candle is bearish
-              data['Close'].iloc[i-1] > data['Open'].iloc[i-1] and  # Previous candle is bullish
-              data['Close'].iloc[i] < data['Open'].iloc[i-1] and  # Current close < previous open
-              data['Open'].iloc[i] > data['Close'].iloc[i-1]):  # Current open > previous close
-            data.loc[data.index[i], 'BearishEngulfing'] = True
+    # Engulfing patterns, comparing each candle with the previous one
+    # (the first candle has no predecessor, so its NaN comparisons are all False)
+    prev_open = np.r_[np.nan, open_[:-1]]
+    prev_close = np.r_[np.nan, close[:-1]]
+    
+    data['BullishEngulfing'] = ((close > open_) &  # Current candle is bullish
+                                (prev_close < prev_open) &  # Previous candle is bearish
+                                (close > prev_open) &  # Current close > previous open
+                                (open_ < prev_close))  # Current open < previous close
+    
+    data['BearishEngulfing'] = ((close < open_) &  # Current candle is bearish
+                                (prev_close > prev_open) &  # Previous candle is bullish
+                                (close < prev_open) &  # Current close < previous open
+                                (open_ > prev_close))  # Current open > previous close
     
     return data
 
+def _distinct_levels(candidates, tolerance=0.02):
+    """Keep each candidate price level unless it lies within tolerance of one already kept"""
+    levels = []
+    for new_level in candidates:
+        if not any(abs(level - new_level) / level < tolerance for level in levels):
+            levels.append(new_level)
+    return levels
+
 def detect_chart_patterns(df, window_size=20):
     """
     Detect common chart patterns like support/resistance, trends
@@ -251,37 +269,36 @@ def detect_chart_patterns(df, window_size=20):
     if df is None or df.empty or len(df) < window_size:
         return {"error": "Not enough data for pattern detection"}
     
-    # Create a copy of the dataframe
-    data = df.copy()
+    # Pull the price columns out once; every scan below runs on plain arrays
+    low = df['Low'].to_numpy()
+    high = df['High'].to_numpy()
+    close = df['Close'].to_numpy()
     
-    # Calculate highs and lows for pattern detection
-    rolling_high = data['High'].rolling(window=window_size, center=True).max()
-    rolling_low = data['Low'].rolling(window=window_size, center=True).min()
-    
-    # Detect support levels (areas where price bounced off lows multiple times)
+    # Each candidate bar is compared with the window that starts one bar before it
+    candidates = np.arange(window_size, len(df) - window_size)
     support_levels = []
-    for i in range(window_size, len(data) - window_size):
-        if (data['Low'].iloc[i] <= data['Low'].iloc[i-1:i+window_size].min() * 1.01 and
-            data['Low'].iloc[i] >= data['Low'].iloc[i-1:i+window_size].min() * 0.99):
-            # Check if this level is close to an existing support level
-            new_level = data['Low'].iloc[i]
-            if not any(abs(level - new_level) / level < 0.02 for level in support_levels):
-                support_levels.append(new_level)
-    
-    # Detect resistance levels (areas where price bounced off highs multiple times)
     resistance_levels = []
-    for i in range(window_size, len(data) - window_size):
-        if (data['High'].iloc[i] >= data['High'].iloc[i-1:i+window_size].max() * 0.99 and
-            data['High'].iloc[i] <= data['High'].iloc[i-1:i+window_size].max() * 1.01):
-            # Check if this level is close to an existing resistance level
-            new_level = data['High'].iloc[i]
-            if not any(abs(level - new_level) / level < 0.02 for level in resistance_levels):
-                resistance_levels.append(new_level)
+    
+    if len(candidates):
+        window_low = sliding_window_view(low, window_size + 1)[candidates - 1].min(axis=1)
+        window_high = sliding_window_view(high, window_size + 1)[candidates - 1].max(axis=1)
+        
+        # Detect support levels (areas where price bounced off lows multiple times)
+        is_support = (low[candidates] <= window_low * 1.01) & (low[candidates] >= window_low * 0.99)
+        support_levels = _distinct_levels(low[candidates[is_support]])
+        
+        # Detect resistance levels (areas where price bounced off highs multiple times)
+        is_resistance = (high[candidates] >= window_high * 0.99) & (high[candidates] <= window_high * 1.01)
+        resistance_levels = _distinct_levels(high[candidates[is_resistance]])
+    
+    # Moving averages used for the trend and the crossover checks
+    ma50 = df['Close'].rolling(window=50).mean().to_numpy()
+    ma200 = df['Close'].rolling(window=200).mean().to_numpy()
     
     # Detect trend
-    current_close = data['Close'].iloc[-1]
-    ma50_last = data['Close'].rolling(window=50).mean().iloc[-1]
-    ma200_last = data['Close'].rolling(window=200).mean().iloc[-1]
+    current_close = close[-1]
+    ma50_last = ma50[-1]
+    ma200_last = ma200[-1]
     
     if current_close > ma50_last and ma50_last > ma200_last:
         trend = "Bullish"
@@ -290,29 +307,16 @@ def detect_chart_patterns(df, window_size=20):
     else:
         trend = "Sideways"
     
+    # Compare each of the last few bars with the bar before it
+    lookback = min(10, len(df))
+    ma50_prev, ma50_curr = ma50[-lookback:-1], ma50[-lookback + 1:]
+    ma200_prev, ma200_curr = ma200[-lookback:-1], ma200[-lookback + 1:]
+    
     # Check for golden cross (50-day MA crosses above 200-day MA)
-    golden_cross = False
-    for i in range(1, min(10, len(data))):
-        ma50_prev = data['Close'].rolling(window=50).mean().iloc[-i-1]
-        ma200_prev = data['Close'].rolling(window=200).mean().iloc[-i-1]
-        ma50_curr = data['Close'].rolling(window=50).mean().iloc[-i]
-        ma200_curr = data['Close'].rolling(window=200).mean().iloc[-i]
-        
-        if ma50_prev < ma200_prev and ma50_curr > ma200_curr:
-            golden_cross = True
-            break
+    golden_cross = bool(np.any((ma50_prev < ma200_prev) & (ma50_curr > ma200_curr)))
     
     # Check for death cross (50-day MA crosses below 200-day MA)
-    death_cross = False
-    for i in range(1, min(10, len(data))):
-        ma50_prev = data['Close'].rolling(window=50).mean().iloc[-i-1]
-        ma200_prev = data['Close'].rolling(window=200).mean().iloc[-i-1]
-        ma50_curr = data['Close'].rolling(window=50).mean().iloc[-i]
-        ma200_curr = data['Close'].rolling(window=200).mean().iloc[-i]
-        
-        if ma50_prev > ma200_prev and ma50_curr < ma200_curr:
-            death_cross = True
-            break
+    death_cross = bool(np.any((ma50_prev > ma200_prev) & (ma50_curr < ma200_curr)))
     
     # Return detected patterns
     return {
@@ -332,11 +336,14 @@ def train_pattern_recognition_model(historical_data, prediction_window=5):
     prediction_window (int): Number of days to predict ahead
     
     Returns:
-    tuple: (trained model, scaler)
+    tuple: (trained model, scaler), where the scaler is None because tree splits are scale-invariant
     """
     if historical_data is None or historical_data.empty:
         return None, None
     
+    # scikit-learn is only needed once a model is trained, so it stays out of app start-up
+    from sklearn.ensemble import RandomForestClassifier
+    
     data = historical_data.copy()
     
     # Feature columns (technical indicators)
@@ -357,42 +364,38 @@ def train_pattern_recognition_model(historical_data, prediction_window=5):
     
     # Split the data, keeping the most recent data for validation
     train_size = int(len(data) * 0.8)
-    X_train = data[feature_cols][:train_size]
-    y_train = data['Target'][:train_size]
-    
-    # Scale the features
-    scaler = MinMaxScaler(feature_range=(0, 1))
-    X_train_scaled = scaler.fit_transform(X_train)
+    # The forest works in float32 internally, so hand it a contiguous float32 array up front
+    X_train = np.ascontiguousarray(data[feature_cols].to_numpy(dtype=np.float32)[:train_size])
+    y_train = data['Target'].to_numpy()[:train_size]
     
-    # Train a random forest classifier
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
-    model.fit(X_train_scaled, y_train)
+    # Train a random forest classifier on all cores
+    model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
+    model.fit(X_train, y_train)
     
-    return model, scaler
+    return model, None
 
-def predict_future_movement(model, scaler, current_data, feature_cols):
+def predict_future_movement(model, scaler, current_features):
     """
     Predict future price movement using the trained model
     
     Parameters:
     model: Trained ML model
-    scaler: Feature scaler
-    current_data (pd.DataFrame): DataFrame with current price data and indicators
-    feature_cols (list): List of feature column names
+    scaler: Feature scaler, or None if the model takes raw features
+    current_features (np.ndarray): 2-D float32 array holding the latest row of feature values
     
     Returns:
     float: Probability of upward movement
     """
-    if model is None or scaler is None or current_data is None or current_data.empty:
+    if model is None or current_features is None or len(current_features) == 0:
         return 0.5  # Default to 50% probability if we can't make a prediction
     
-    # Prepare the features
-    X = current_data[feature_cols].iloc[-1:].values
+    X = current_features
     
     # Scale the features
-    X_scaled = scaler.transform(X)
+    if scaler is not None:
+        X = scaler.transform(X)
     
     # Make prediction
-    prediction_prob = model.predict_proba(X_scaled)[0][1]
+    prediction_prob = model.predict_proba(X)[0][1]
     
     return prediction_prob
@@ -241,6 +241,22 @@ def get_real_time_quotes(tickers):
         print(f"Error getting real-time quotes: {e}")
         return None
 
+def get_options_expirations(ticker):
+    """
+    Get the available options expiration dates for a given ticker
+    
+    Parameters:
+    ticker (str): Stock ticker symbol
+    
+    Returns:
+    tuple: Expiration dates, empty if the ticker has no listed options
+    """
+    try:
+        return tuple(yf.Ticker(ticker).options)
+    except Exception as e:
+        print(f"Error fetching options expirations for {ticker}: {e}")
+        return ()
+
 def get_futures_options_data(ticker, selected_expiration=None):
     """
     Get futures and options data for a given ticker
@@ -263,8 +279,9 @@ def get_futures_options_data(ticker, selected_expiration=None):
         
         # Use the specified expiration or the nearest one
         target_expiration = selected_expiration if selected_expiration in expirations else expirations[0]
-        calls = stock.option_chain(target_expiration).calls
-        puts = stock.option_chain(target_expiration).puts
+        option_chain = stock.option_chain(target_expiration)
+        calls = option_chain.calls
+        puts = option_chain.puts
         
         # Get current stock price for context
         current_price = stock.info.get('regularMarketPrice', None) or stock.info.get('currentPrice', None)